@@ -0,0 +1,364 @@
+"""
+Benchmark de los solvers con calentamiento, repeticiones y percentiles.
+
+Cada puzzle se resuelve primero --warmup veces sin medir y después --repeat veces
+midiendo con perf_counter_ns (con el recolector de basura apagado, como timeit).
+El tiempo de un puzzle es la mediana de sus repeticiones, y por cada dificultad y
+motor se reportan mediana, p95, p99, media y desvío estándar sobre los puzzles.
+
+Los puzzles salen de utils.corpus: generados con --seed (la misma semilla da los
+mismos puzzles en cualquier máquina) o leídos de un corpus con --corpus (un
+conjunto incluido como 'hard17' / 'hardest' o un archivo de 81 caracteres por línea).
+
+Los resultados se pueden guardar como línea base (--save-baseline) y comparar en
+otra corrida (--baseline): se marca como regresión todo motor/dificultad cuya
+mediana empeore más que --threshold.
+
+Con --value-order se agregan variantes '<motor>+<orden>' de los motores que
+aceptan un orden de valores (utils.ordering), para comparar los nodos de cada orden.
+
+Con --startup mide además cuánto tardan en importarse los puntos de entrada
+(python -X importtime) y falla si alguno se pasa de --startup-budget ms.
+
+Ejemplos:
+    python benchmark.py --engine backtracking --difficulty hard --count 20
+    python benchmark.py --corpus hardest --corpus hard17 --engine dancing_links
+    python benchmark.py --engine branch_and_bound --value-order lcv --value-order frequency
+    python benchmark.py --save-baseline base.json
+    python benchmark.py --baseline base.json --threshold 0.1
+    python benchmark.py --startup
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+from time import perf_counter_ns
+from typing import NamedTuple, Optional
+from utils.board import Board
+from utils.budget import Budget, BudgetExceeded
+from utils.corpus import bundled_sets, generate_puzzles, load_corpus
+from utils.ordering import VALUE_ORDERS
+from utils.solvers import VALUE_ORDER_SOLVERS, check_options, get_solver
+from utils.stats import SolveStats
+
+BASELINE_VERSION = 1
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+# Módulos de entrada cuyo tiempo de importación se controla con --startup
+STARTUP_MODULES = ["solve", "benchmark", "tests", "main"]
+STARTUP_BUDGET_MS = 60.0
+
+# nombre -> (solver en utils.solvers, opciones del solver)
+ENGINES = {
+    "backtracking": ("backtracking", {}),
+    "backtracking_iterative": ("backtracking_iterative", {}),
+    "branch_and_bound": ("branch_and_bound", {}),
+    "dancing_links": ("dancing_links", {}),
+    "branch_and_bound+cola_acotada": ("branch_and_bound", {"max_queue": 1000}),
+    "backtracking+propagacion": ("backtracking", {"propagate": True}),
+    "branch_and_bound+propagacion": ("branch_and_bound", {"propagate": True}),
+}
+
+
+class Measurement(NamedTuple):
+    ns: int       # mediana de las repeticiones
+    nodes: int    # candidatos probados (no depende de la repetición)
+    status: str   # 'solved', 'unsolvable' o 'timeout'
+
+
+class Summary(NamedTuple):
+    difficulty: str
+    engine: str
+    count: int
+    median_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    stdev_ms: float
+    nodes_mean: float
+    timeouts: int
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Percentil q (0-100) con interpolación lineal, sobre valores ya ordenados."""
+    if not sorted_values:
+        return math.nan
+    position = (len(sorted_values) - 1) * q / 100
+    low = math.floor(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+def _run_once(puzzle: Board, algorithm: str, options: dict, time_limit: Optional[float]) -> tuple[int, int, str]:
+    """Una resolución medida: (nanosegundos, candidatos probados, estado)."""
+    _, solver = get_solver(algorithm)
+    # La copia de trabajo se arma fuera de la medición
+    board = puzzle.to_matrix()
+    stats = SolveStats()
+    if time_limit is not None:
+        options = dict(options, budget=Budget(time_limit))
+
+    start = perf_counter_ns()
+    try:
+        solution = solver(board, stats=stats, **options)
+        status = 'solved' if solution is not None else 'unsolvable'
+    except BudgetExceeded:
+        status = 'timeout'
+    elapsed = perf_counter_ns() - start
+    return elapsed, stats.candidates_tried, status
+
+
+def measure(puzzle: Board, algorithm: str, options: dict, warmup: int = 1, repeat: int = 5,
+            time_limit: Optional[float] = None) -> Measurement:
+    """
+    Mide un puzzle con un solver.
+
+    Args:
+        puzzle: Puzzle a resolver (no se modifica)
+        algorithm: Nombre del solver en utils.solvers
+        options: Opciones del solver
+        warmup: Resoluciones previas que no se miden
+        repeat: Resoluciones medidas; se devuelve la mediana
+        time_limit: Segundos máximos por resolución. Un puzzle que se pasa se
+            marca 'timeout' y no se repite.
+    """
+    for _ in range(warmup):
+        _, _, status = _run_once(puzzle, algorithm, options, time_limit)
+        if status == 'timeout':
+            return Measurement(int(time_limit * 1e9), 0, status)
+
+    samples = []
+    nodes, status = 0, 'solved'
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(max(repeat, 1)):
+            elapsed, nodes, status = _run_once(puzzle, algorithm, options, time_limit)
+            samples.append(elapsed)
+            if status == 'timeout':
+                break
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    samples.sort()
+    return Measurement(int(percentile(samples, 50)), nodes, status)
+
+
+def summarize(difficulty: str, engine: str, measurements: list[Measurement]) -> Summary:
+    times = sorted(m.ns / 1e6 for m in measurements)
+    count = len(times)
+    mean = sum(times) / count if count else math.nan
+    stdev = math.sqrt(sum((t - mean) ** 2 for t in times) / (count - 1)) if count > 1 else 0.0
+    return Summary(
+        difficulty=difficulty,
+        engine=engine,
+        count=count,
+        median_ms=percentile(times, 50),
+        p95_ms=percentile(times, 95),
+        p99_ms=percentile(times, 99),
+        mean_ms=mean,
+        stdev_ms=stdev,
+        nodes_mean=sum(m.nodes for m in measurements) / count if count else math.nan,
+        timeouts=sum(1 for m in measurements if m.status == 'timeout'),
+    )
+
+
+def with_value_orders(engines: list[str], orders: list[str]) -> dict[str, tuple[str, dict]]:
+    """
+    Motores a correr (nombre -> (solver, opciones)): cada motor de ENGINES seguido de
+    sus variantes '<motor>+<orden>' si el solver acepta value_order.
+    """
+    selected = {}
+    for engine in engines:
+        algorithm, options = ENGINES[engine]
+        check_options(algorithm, options)
+        selected[engine] = (algorithm, options)
+        if algorithm not in VALUE_ORDER_SOLVERS:
+            continue
+        for order in orders:
+            selected[f"{engine}+{order}"] = (algorithm, dict(options, value_order=order))
+    return selected
+
+
+def run(engines: dict[str, tuple[str, dict]], puzzle_sets: dict[str, list[Board]], warmup: int = 1,
+        repeat: int = 5, time_limit: Optional[float] = None, verbose: bool = True) -> list[Summary]:
+    """
+    Corre el benchmark: todos los motores (nombre -> (solver, opciones)) sobre los mismos
+    puzzles de cada conjunto (dificultad o corpus).
+    """
+    summaries = []
+    for difficulty, puzzles in puzzle_sets.items():
+        for engine, (algorithm, options) in engines.items():
+            measurements = [measure(p, algorithm, options, warmup, repeat, time_limit) for p in puzzles]
+            summary = summarize(difficulty, engine, measurements)
+            summaries.append(summary)
+            if verbose:
+                print(format_summary(summary), flush=True)
+    return summaries
+
+
+def format_summary(s: Summary) -> str:
+    timeouts = f" | timeouts: {s.timeouts}" if s.timeouts else ""
+    return (f"{s.difficulty:<8} {s.engine:<40} n={s.count:<4} mediana {s.median_ms:9.3f} ms | "
+            f"p95 {s.p95_ms:9.3f} | p99 {s.p99_ms:9.3f} | media {s.mean_ms:9.3f} ± {s.stdev_ms:8.3f} | "
+            f"nodos {s.nodes_mean:,.0f}{timeouts}")
+
+
+def save_baseline(path: str, summaries: list[Summary], config: dict):
+    data = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "config": config,
+        "results": [s._asdict() for s in summaries],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_baseline(path: str) -> tuple[dict, list[Summary]]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Versión de línea base no soportada: {data.get('version')!r}")
+    return data["config"], [Summary(**row) for row in data["results"]]
+
+
+def compare(current: list[Summary], baseline: list[Summary]) -> list[tuple[Summary, Summary, float]]:
+    """
+    Compara las medianas con la línea base.
+
+    Returns:
+        list: (actual, base, cociente actual/base) de cada motor/dificultad presente en ambas
+    """
+    base_by_key = {(s.difficulty, s.engine): s for s in baseline}
+    rows = []
+    for s in current:
+        base = base_by_key.get((s.difficulty, s.engine))
+        if base is not None and base.median_ms > 0:
+            rows.append((s, base, s.median_ms / base.median_ms))
+    return rows
+
+
+def print_comparison(rows: list[tuple[Summary, Summary, float]], threshold: float) -> int:
+    """Imprime la comparación y devuelve la cantidad de regresiones."""
+    regressions = 0
+    print("\n" + "=" * 70)
+    print(f"COMPARACIÓN CON LA LÍNEA BASE (umbral {threshold:.0%})")
+    print("=" * 70)
+    for s, base, ratio in rows:
+        if ratio > 1 + threshold:
+            mark = "REGRESIÓN"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            mark = "mejora"
+        else:
+            mark = "="
+        print(f"{s.difficulty:<8} {s.engine:<40} {base.median_ms:9.3f} -> {s.median_ms:9.3f} ms "
+              f"({ratio - 1:+.1%}) {mark}")
+    return regressions
+
+
+def measure_startup(module: str, runs: int = 5) -> float:
+    """
+    Tiempo de importación (ms) de un módulo de src/, según python -X importtime.
+
+    Se toma el mínimo de varias corridas en procesos nuevos: la primera puede incluir
+    la compilación a .pyc y el resto del ruido sólo suma.
+    """
+    import subprocess  # sólo hace falta en este modo
+
+    src = os.path.dirname(os.path.abspath(__file__))
+    best = math.inf
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              cwd=src, capture_output=True, text=True, check=True)
+        # Formato: "import time: <propio us> | <acumulado us> | <módulo>"
+        for line in proc.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                best = min(best, int(parts[1]) / 1000)
+    return best
+
+
+def check_startup(modules: list[str], budget_ms: float) -> int:
+    """Imprime el tiempo de importación de cada módulo y devuelve cuántos se pasan del presupuesto."""
+    print("=" * 70)
+    print(f"TIEMPO DE ARRANQUE (presupuesto {budget_ms:.0f} ms)")
+    print("=" * 70)
+    over = 0
+    for module in modules:
+        ms = measure_startup(module)
+        mark = "" if ms <= budget_ms else "  EXCEDIDO"
+        over += ms > budget_ms
+        print(f"{module:<12} {ms:8.1f} ms{mark}")
+    return over
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark de los solvers de Sudoku")
+    parser.add_argument("--engine", action="append", choices=list(ENGINES),
+                        help="Motor a medir (se puede repetir; por defecto todos)")
+    parser.add_argument("--difficulty", action="append", choices=DIFFICULTIES,
+                        help="Dificultad a medir (se puede repetir; por defecto todas)")
+    parser.add_argument("--count", type=int, default=20, help="Puzzles por dificultad (o máximo por corpus)")
+    parser.add_argument("--seed", default="0", help="Semilla de los puzzles generados")
+    parser.add_argument("--corpus", action="append",
+                        help=f"Medir sobre un corpus en lugar de generar puzzles ({', '.join(bundled_sets())} "
+                             "o la ruta de un archivo; se puede repetir)")
+    parser.add_argument("--value-order", action="append", choices=[o for o in VALUE_ORDERS if o != "natural"],
+                        help="Agregar variantes con este orden de valores (repetible)")
+    parser.add_argument("--warmup", type=int, default=1, help="Resoluciones sin medir por puzzle")
+    parser.add_argument("--repeat", type=int, default=5, help="Resoluciones medidas por puzzle")
+    parser.add_argument("--time-limit", type=float, default=None, help="Segundos máximos por resolución")
+    parser.add_argument("--baseline", help="Línea base (JSON) contra la cual comparar")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Empeoramiento relativo de la mediana que cuenta como regresión")
+    parser.add_argument("--save-baseline", help="Guardar los resultados como línea base (JSON)")
+    parser.add_argument("--startup", action="store_true",
+                        help="Sólo medir el tiempo de importación de los puntos de entrada")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_MS,
+                        help="Milisegundos máximos de importación por punto de entrada")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.startup:
+        return 1 if check_startup(STARTUP_MODULES, args.startup_budget) else 0
+
+    engines = with_value_orders(args.engine or list(ENGINES), args.value_order or [])
+    if args.corpus:
+        puzzle_sets = {name: load_corpus(name)[:args.count] for name in args.corpus}
+    else:
+        puzzle_sets = {difficulty: generate_puzzles(difficulty, args.count, args.seed)
+                       for difficulty in args.difficulty or DIFFICULTIES}
+
+    summaries = run(engines, puzzle_sets, args.warmup, args.repeat, args.time_limit)
+
+    config = {"count": args.count, "seed": args.seed, "corpus": args.corpus, "warmup": args.warmup,
+              "repeat": args.repeat, "time_limit": args.time_limit}
+    if args.save_baseline:
+        save_baseline(args.save_baseline, summaries, config)
+        print(f"\nLínea base guardada en: {args.save_baseline}")
+
+    if args.baseline:
+        base_config, baseline = load_baseline(args.baseline)
+        different = [key for key in ("count", "seed", "corpus") if base_config.get(key) != config[key]]
+        if different:
+            print(f"\nAviso: la línea base usó otros puzzles ({', '.join(different)} distintos)")
+        rows = compare(summaries, baseline)
+        if print_comparison(rows, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
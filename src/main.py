@@ -9,19 +9,35 @@ Reglas de juego:
 
 from __future__ import annotations
 
+import queue
+import threading
 import time
 import tkinter as tk
 from tkinter import font as tkfont
-from typing import Literal, Callable
+from itertools import islice
+from typing import Iterator, Literal, Callable
 
-from utils.backtracking import iniciateBaseMatrix, backtracking
-from utils.byb import branch_and_bound
-from utils.counter import reset, get_count
-from utils.utils import makeDifficulty, isFactible
+from utils.backtracking import Step, iniciateBaseMatrix, iter_backtracking_steps
+from utils.batch import SolveResult, solve_one
+from utils.budget import CancellationToken
+from utils.byb import iter_branch_and_bound_steps
+from utils.counter import reset
+from utils.playboard import PlayBoard
+from utils.stats import SolveStats
+from utils.utils import makeDifficulty
 
 
 Difficulty = Literal["easy", "medium", "hard"]
 
+# Cada cuánto (ms) la GUI revisa la cola de mensajes del hilo que resuelve (~60 fps)
+POLL_MS = 16
+# Duración de un cuadro de la animación: con velocidades más rápidas se dibujan
+# varios pasos por cuadro
+FRAME_MS = 16
+
+# Solvers del modo auto-resolver: (clave del panel, nombre en utils.solvers)
+AUTO_SOLVERS = (("bt", "backtracking"), ("bnb", "branch_and_bound"), ("dlx", "dancing_links"))
+
 
 class SudokuGUI(tk.Tk):
     def __init__(self) -> None:
@@ -47,6 +63,17 @@ class SudokuGUI(tk.Tk):
         self.animation_running = False
         self.animation_speed = 50  # ms entre pasos
 
+        # Resolución en segundo plano: los solvers corren en un hilo aparte y
+        # mandan sus resultados por una cola que la GUI lee con after()
+        self.solve_thread: threading.Thread | None = None
+        self.solve_token: CancellationToken | None = None
+        self.solve_queue: queue.Queue = queue.Queue()
+
+        # Pasos de la animación: se generan de a uno desde el solver (no se guardan)
+        self.anim_stream: Iterator[Step] | None = None
+        self.anim_count = 0
+        self.anim_last: Step | None = None
+
         # Frames principales
         self.frame_start = tk.Frame(self, padx=16, pady=16)
         self.frame_board = tk.Frame(self, padx=16, pady=16)
@@ -76,7 +103,10 @@ class SudokuGUI(tk.Tk):
         btns = tk.Frame(self.frame_start)
         btns.pack(pady=(12, 0))
         tk.Button(btns, text="Jugar", width=18, command=self._start_play, font=self.font_button).pack(side="left", padx=6)
-        tk.Button(btns, text="Resolver automáticamente", width=22, command=self._start_auto, font=self.font_button).pack(side="left", padx=6)
+        # Deshabilitado mientras corre una resolución (también si se canceló y el hilo todavía no terminó)
+        self.btn_start_auto = tk.Button(btns, text="Resolver automáticamente", width=22, command=self._start_auto,
+                                        font=self.font_button)
+        self.btn_start_auto.pack(side="left", padx=6)
         tk.Button(btns, text="Ver animación", width=18, command=self._start_animated, font=self.font_button).pack(side="left", padx=6)
 
     def _build_board_screen(self):
@@ -95,6 +125,9 @@ class SudokuGUI(tk.Tk):
         self.entries: list[list[tk.Entry]] = [[None for _ in range(9)] for _ in range(9)]  # type: ignore
         self.widget_to_pos: dict[str, tuple[int, int]] = {}
         self.pending_clear: dict[tuple[int, int], str] = {}
+        # Valores y conflictos del modo Jugar (la validación no lee los widgets)
+        self.play_board: PlayBoard | None = None
+        self.highlighted: list[tuple[int, int, str, str]] = []  # (fila, columna, bg y disabledbackground originales)
 
         for r in range(9):
             for c in range(9):
@@ -125,7 +158,17 @@ class SudokuGUI(tk.Tk):
         self.panel_bnb = self._create_result_panel(container, "Branch & Bound")
         self.panel_bnb.pack(side="left", padx=10)
 
-        tk.Button(self.frame_results, text="Volver", command=lambda: self._show_frame(self.frame_start), font=self.font_button).pack(pady=(10, 0))
+        self.panel_dlx = self._create_result_panel(container, "Dancing Links")
+        self.panel_dlx.pack(side="left", padx=10)
+
+        self.result_panels = {"bt": self.panel_bt, "bnb": self.panel_bnb, "dlx": self.panel_dlx}
+
+        btns = tk.Frame(self.frame_results)
+        btns.pack(pady=(10, 0))
+        self.btn_cancel_auto = tk.Button(btns, text="Cancelar", command=self._cancel_solving,
+                                         font=self.font_button, state="disabled")
+        self.btn_cancel_auto.pack(side="left", padx=6)
+        tk.Button(btns, text="Volver", command=self._leave_results, font=self.font_button).pack(side="left", padx=6)
 
     def _build_animated_screen(self):
         """Construye la pantalla de animación"""
@@ -186,7 +229,7 @@ class SudokuGUI(tk.Tk):
                                        command=self._pause_animation, font=self.font_button, state="disabled")
         self.btn_pause_anim.pack(side="left", padx=5)
         tk.Button(btn_frame, text="Volver", width=12, 
-                 command=lambda: self._show_frame(self.frame_start), font=self.font_button).pack(side="left", padx=5)
+                 command=self._leave_animation, font=self.font_button).pack(side="left", padx=5)
 
     def _create_result_panel(self, parent: tk.Widget, title: str) -> tk.Frame:
         frame = tk.Frame(parent, bd=2, relief="groove", padx=10, pady=10)
@@ -222,6 +265,8 @@ class SudokuGUI(tk.Tk):
         self.solution = solution  # no se usa para validar entradas
         self.puzzle = puzzle
         self.fixed = [[puzzle[r][c] != 0 for c in range(9)] for r in range(9)]
+        self.play_board = PlayBoard(puzzle)
+        self._clear_highlight()
 
         reset()
 
@@ -231,6 +276,8 @@ class SudokuGUI(tk.Tk):
     def _restart_play(self):
         if self.puzzle is None:
             return
+        self.play_board = PlayBoard(self.puzzle)
+        self._clear_highlight()
         for r in range(9):
             for c in range(9):
                 e = self.entries[r][c]
@@ -248,20 +295,8 @@ class SudokuGUI(tk.Tk):
         solution = [row[:] for row in base]
         puzzle = makeDifficulty([row[:] for row in solution], self.difficulty)
 
-        reset()
-        t0 = time.perf_counter()
-        solved_bt = backtracking([row[:] for row in puzzle])
-        t1 = time.perf_counter()
-        tries_bt = get_count("backtracking")
-
-        reset()
-        t2 = time.perf_counter()
-        solved_bnb = branch_and_bound([row[:] for row in puzzle])
-        t3 = time.perf_counter()
-        tries_bnb = get_count()
-
-        self._render_result_panel(self.panel_bt, solved_bt, t1 - t0, tries_bt)
-        self._render_result_panel(self.panel_bnb, solved_bnb, t3 - t2, tries_bnb)
+        for panel in self.result_panels.values():
+            self._render_result_panel(panel, None, 0.0, 0, status="pending")
 
         total_empty = sum(1 for i in range(9) for j in range(9) if puzzle[i][j] == 0)
         info = f"Dificultad: {self.difficulty} · Celdas vacías: {total_empty}"
@@ -273,6 +308,71 @@ class SudokuGUI(tk.Tk):
 
         self._show_frame(self.frame_results)
 
+        # Resolver fuera del hilo de Tk para que la ventana no se congele
+        self.solve_token = CancellationToken()
+        self.solve_queue = queue.Queue()
+        self.btn_start_auto.config(state="disabled")
+        self.btn_cancel_auto.config(state="normal")
+        self.solve_thread = threading.Thread(
+            target=self._solve_worker, args=(puzzle, self.solve_token, self.solve_queue), daemon=True
+        )
+        self.solve_thread.start()
+        self.after(POLL_MS, self._poll_solvers, self.solve_queue, self.solve_token, None)
+
+    def _solve_worker(self, puzzle: list[list[int]], token: CancellationToken, messages: queue.Queue):
+        """Corre en el hilo de fondo: NO toca widgets, sólo manda mensajes por la cola."""
+        for key, algorithm in AUTO_SOLVERS:
+            stats = SolveStats()
+            messages.put(("start", key, stats))
+            result = solve_one(puzzle, algorithm, token=token, stats=stats)
+            messages.put(("done", key, result))
+        messages.put(("finished",))
+
+    def _poll_solvers(self, messages: queue.Queue, token: CancellationToken,
+                      progress: tuple[str, SolveStats, float] | None):
+        """
+        Lee los mensajes del hilo de fondo y actualiza los paneles (en el hilo de Tk).
+
+        Cada corrida tiene su propia cadena de after() con la cola y el token con que se
+        lanzó; progress es (panel, stats, inicio) del solver en curso.
+        """
+        finished = False
+        try:
+            while True:
+                message = messages.get_nowait()
+                if message[0] == "start":
+                    _, key, stats = message
+                    progress = (key, stats, time.perf_counter())
+                elif message[0] == "done":
+                    _, key, result = message
+                    progress = None
+                    self._render_solve_result(self.result_panels[key], result)
+                else:
+                    finished = True
+        except queue.Empty:
+            pass
+
+        if progress is not None:
+            key, stats, started = progress
+            panel = self.result_panels[key]
+            panel.label_time.config(text=f"Resolviendo... {time.perf_counter() - started:.1f} s")
+            panel.label_tries.config(text=f"Intentos: {stats.candidates_tried:,}")
+
+        if finished:
+            if token is self.solve_token:
+                self.btn_cancel_auto.config(state="disabled")
+                self.btn_start_auto.config(state="normal")
+        else:
+            self.after(POLL_MS, self._poll_solvers, messages, token, progress)
+
+    def _cancel_solving(self):
+        if self.solve_token is not None:
+            self.solve_token.cancel()
+
+    def _leave_results(self):
+        self._cancel_solving()
+        self._show_frame(self.frame_start)
+
     def _start_animated(self):
         """Inicia la pantalla de animación"""
         self.difficulty = self.diff_var.get()  # type: ignore[assignment]
@@ -281,7 +381,19 @@ class SudokuGUI(tk.Tk):
         self.puzzle = makeDifficulty([row[:] for row in solution], self.difficulty)
         self.fixed = [[self.puzzle[r][c] != 0 for c in range(9)] for r in range(9)]
         
-        # Limpiar tablero animado
+        self._reset_anim_board()
+        
+        self.anim_info.config(text=f"Dificultad: {self.difficulty} · Presiona 'Iniciar' para comenzar")
+        self.btn_start_anim.config(state="normal")
+        self.btn_pause_anim.config(state="disabled")
+        self.animation_running = False
+        self.anim_stream = None
+        
+        self._show_frame(self.frame_animated)
+
+    def _reset_anim_board(self):
+        """Muestra el puzzle sin resolver en el tablero animado"""
+        assert self.puzzle is not None
         for r in range(9):
             for c in range(9):
                 val = self.puzzle[r][c]
@@ -290,13 +402,6 @@ class SudokuGUI(tk.Tk):
                     fg="#000000" if val != 0 else "#666666",
                     bg="#e0e0e0" if val != 0 else ("#f7f7f7" if ((r // 3) + (c // 3)) % 2 == 0 else "#ffffff")
                 )
-        
-        self.anim_info.config(text=f"Dificultad: {self.difficulty} · Presiona 'Iniciar' para comenzar")
-        self.btn_start_anim.config(state="normal")
-        self.btn_pause_anim.config(state="disabled")
-        self.animation_running = False
-        
-        self._show_frame(self.frame_animated)
 
     def _update_speed(self, value):
         """Actualiza la velocidad de animación"""
@@ -311,16 +416,18 @@ class SudokuGUI(tk.Tk):
         self.btn_start_anim.config(state="disabled")
         self.btn_pause_anim.config(state="normal")
         
-        algo = self.anim_algo_var.get()
-        puzzle_copy = [row[:] for row in self.puzzle]  # type: ignore
-        
-        # Crear generador de pasos
-        if algo == "backtracking":
-            steps = self._backtracking_steps(puzzle_copy, 0)
-        else:
-            steps = self._bnb_steps(puzzle_copy)
-        
-        self._animate_steps(steps, 0)
+        if self.anim_stream is None:
+            # Nueva animación (si estaba pausada, se sigue desde el mismo punto)
+            puzzle_copy = [row[:] for row in self.puzzle]  # type: ignore
+            if self.anim_algo_var.get() == "backtracking":
+                self.anim_stream = iter_backtracking_steps(puzzle_copy)
+            else:
+                self.anim_stream = iter_branch_and_bound_steps(puzzle_copy)
+            self.anim_count = 0
+            self.anim_last = None
+            self._reset_anim_board()
+
+        self._animate_steps()
 
     def _pause_animation(self):
         """Pausa la animación"""
@@ -328,117 +435,60 @@ class SudokuGUI(tk.Tk):
         self.btn_start_anim.config(state="normal")
         self.btn_pause_anim.config(state="disabled")
 
-    def _animate_steps(self, steps: list[tuple[int, int, int, str]], index: int):
-        """Anima los pasos uno por uno"""
-        if not self.animation_running or index >= len(steps):
+    def _leave_animation(self):
+        self._pause_animation()
+        self.anim_stream = None
+        self._show_frame(self.frame_start)
+
+    def _animate_steps(self):
+        """Consume los pasos del solver de a un cuadro por vez"""
+        if not self.animation_running or self.anim_stream is None:
+            return
+
+        # A velocidades altas se procesan varios pasos por cuadro y cada celda
+        # se dibuja una sola vez, con su último estado
+        if self.animation_speed >= FRAME_MS:
+            per_frame, delay = 1, self.animation_speed
+        else:
+            per_frame, delay = FRAME_MS // self.animation_speed, FRAME_MS
+
+        pending: dict[tuple[int, int], Step] = {}
+        consumed = 0
+        for step in islice(self.anim_stream, per_frame):
+            pending[(step[0], step[1])] = step
+            self.anim_last = step
+            consumed += 1
+        self.anim_count += consumed
+
+        for row, col, value, action in pending.values():
+            self._draw_anim_step(row, col, value, action)
+
+        if consumed < per_frame:
+            # El solver terminó
+            self.anim_stream = None
             self.animation_running = False
             self.btn_start_anim.config(state="normal")
             self.btn_pause_anim.config(state="disabled")
-            if index >= len(steps):
-                self.anim_info.config(text=f"✓ Completado! ({len(steps)} pasos)")
+            if self.anim_last is not None and self.anim_last[3] == "success":
+                self.anim_info.config(text=f"✓ Completado! ({self.anim_count} pasos)")
+            else:
+                self.anim_info.config(text=f"✗ Sin solución ({self.anim_count} pasos)")
             return
-        
-        row, col, value, action = steps[index]
-        
-        # Actualizar celda
+
+        row, col, value, _ = self.anim_last  # type: ignore[misc]
+        self.anim_info.config(text=f"Paso {self.anim_count} · Celda ({row},{col}) = {value}")
+
+        # Programar siguiente cuadro
+        self.after(delay, self._animate_steps)
+
+    def _draw_anim_step(self, row: int, col: int, value: int, action: str):
         if action == "try":
             self.anim_cells[row][col].config(text=str(value), fg="#0066cc", bg="#e3f2fd")
         elif action == "backtrack":
-            self.anim_cells[row][col].config(text="", fg="#666666", 
+            self.anim_cells[row][col].config(text="", fg="#666666",
                                             bg="#f7f7f7" if ((row // 3) + (col // 3)) % 2 == 0 else "#ffffff")
         elif action == "success":
             self.anim_cells[row][col].config(text=str(value), fg="#006400", bg="#c8e6c9")
-        
-        self.anim_info.config(text=f"Paso {index + 1}/{len(steps)} · Celda ({row},{col}) = {value}")
-        
-        # Programar siguiente paso
-        self.after(self.animation_speed, lambda: self._animate_steps(steps, index + 1))
-
-    def _backtracking_steps(self, board: list[list[int]], cell_index: int) -> list[tuple[int, int, int, str]]:
-        """Genera los pasos del backtracking"""
-        steps: list[tuple[int, int, int, str]] = []
-        
-        def solve(ci: int) -> bool:
-            if ci == 81:
-                return True
-            
-            row, col = divmod(ci, 9)
-            
-            if board[row][col] != 0:
-                return solve(ci + 1)
-            
-            from utils.utils import generateValues
-            for value in generateValues():
-                steps.append((row, col, value, "try"))
-                board[row][col] = value
-                
-                if isFactible(board, value, row, col):
-                    if solve(ci + 1):
-                        steps.append((row, col, value, "success"))
-                        return True
-                
-                board[row][col] = 0
-                steps.append((row, col, value, "backtrack"))
-            
-            return False
-        
-        solve(0)
-        return steps
-
-    def _bnb_steps(self, matrix: list[list[int]]) -> list[tuple[int, int, int, str]]:
-        """Genera los pasos del Branch and Bound (simplificado)"""
-        steps: list[tuple[int, int, int, str]] = []
-        
-        def solve() -> bool:
-            # Encontrar celda vacía con menos opciones
-            min_options = 10
-            best_cell = None
-            
-            for r in range(9):
-                for c in range(9):
-                    if matrix[r][c] == 0:
-                        options = self._get_valid_values(matrix, r, c)
-                        if len(options) < min_options:
-                            min_options = len(options)
-                            best_cell = (r, c, options)
-            
-            if best_cell is None:
-                return True  # Completo
-            
-            row, col, options = best_cell
-            
-            for value in sorted(options):
-                steps.append((row, col, value, "try"))
-                matrix[row][col] = value
-                
-                if solve():
-                    steps.append((row, col, value, "success"))
-                    return True
-                
-                matrix[row][col] = 0
-                steps.append((row, col, value, "backtrack"))
-            
-            return False
-        
-        solve()
-        return steps
-
-    def _get_valid_values(self, matrix: list[list[int]], row: int, col: int) -> set[int]:
-        """Obtiene valores válidos para una celda"""
-        used = set()
-        
-        # Fila y columna
-        for i in range(9):
-            used.add(matrix[row][i])
-            used.add(matrix[i][col])
-        
-        # Subcuadro
-        box_r, box_c = (row // 3) * 3, (col // 3) * 3
-        for i in range(3):
-            for j in range(3):
-                used.add(matrix[box_r + i][box_c + j])
-        
-        return set(range(1, 10)) - used
 
     # -------- Render helpers --------
     def _render_board(self):
@@ -455,14 +505,23 @@ class SudokuGUI(tk.Tk):
                     e.insert(0, str(val))
                     e.configure(state="disabled", disabledforeground="#000000")
 
-    def _render_result_panel(self, panel: tk.Frame, matrix: list[list[int]] | None, elapsed: float, tries: int):
+    def _render_result_panel(self, panel: tk.Frame, matrix: list[list[int]] | None, elapsed: float, tries: int,
+                             status: str = "solved"):
         for r in range(9):
             for c in range(9):
                 lbl: tk.Label = panel.grid_cells[r][c]  # type: ignore[attr-defined]
                 lbl.config(text=str(matrix[r][c]) if matrix else "·")
-        panel.label_time.config(text=f"Tiempo: {elapsed:.6f} s")
+        if status == "pending":
+            panel.label_time.config(text="Tiempo: -")
+            panel.label_tries.config(text="Intentos: -")
+            return
+        estado = "" if status == "solved" else f" ({status})"
+        panel.label_time.config(text=f"Tiempo: {elapsed:.6f} s{estado}")
         panel.label_tries.config(text=f"Intentos: {tries}")
 
+    def _render_solve_result(self, panel: tk.Frame, result: SolveResult):
+        self._render_result_panel(panel, result.solution, result.time, result.nodes, result.status)
+
     # -------- Validación y feedback --------
     def _validate_input_cell(self, proposed: str, action: str, widget_path: str) -> bool:
         # Permitir borrar
@@ -493,29 +552,20 @@ class SudokuGUI(tk.Tk):
 
         if text == "":
             e.configure(fg="#000000")
+            self._set_play_value(row, col, 0)
             return
         if not text.isdigit():
             return
 
-        # Construir tablero actual y validar contexto
-        matrix: list[list[int]] = [[0 for _ in range(9)] for _ in range(9)]
-        for r in range(9):
-            for c in range(9):
-                t = self.entries[r][c].get().strip()
-                if t.isdigit():
-                    matrix[r][c] = int(t)
-
         value = int(text)
-        matrix[row][col] = value
-
-        if isFactible(matrix, value, row, col):
+        if self._set_play_value(row, col, value):
             # Válido en el contexto actual: sin pistas, sólo normalizar color
             e.configure(fg="#000000")
             
             # Verificar si el sudoku está completo
-            self._check_completion(matrix)
+            self._check_completion()
         else:
-            # Mostrar en rojo brevemente y borrar automáticamente
+            # Mostrar en rojo brevemente (junto con los vecinos en conflicto) y borrar automáticamente
             e.configure(fg="#b00020")
 
             last_text = text
@@ -525,6 +575,7 @@ class SudokuGUI(tk.Tk):
                 if current == last_text:
                     e.delete(0, tk.END)
                     e.configure(fg="#000000")
+                    self._set_play_value(row, col, 0)
                 # limpiar id pendiente
                 if key in self.pending_clear:
                     del self.pending_clear[key]
@@ -532,23 +583,27 @@ class SudokuGUI(tk.Tk):
             after_id = self.after(500, clear_if_unchanged)
             self.pending_clear[key] = after_id
 
-    def _check_completion(self, matrix: list[list[int]]):
-        """Verifica si el Sudoku está completado correctamente"""
-        # 1. Verificar que no haya celdas vacías
-        for r in range(9):
-            for c in range(9):
-                if matrix[r][c] == 0:
-                    return  # Aún hay celdas vacías
-        
-        # 2. Verificar que todas las celdas sean válidas
-        for r in range(9):
-            for c in range(9):
-                value = matrix[r][c]
-                if not isFactible(matrix, value, r, c):
-                    return  # Hay errores
-        
-        # 3. ¡Sudoku completado correctamente!
-        self._show_victory()
+    def _set_play_value(self, row: int, col: int, value: int) -> bool:
+        """Actualiza el tablero de juego y el resaltado de conflictos. True si la celda es válida."""
+        assert self.play_board is not None
+        valid = self.play_board.set(row, col, value)
+        self._clear_highlight()
+        if not valid:
+            for r, c in self.play_board.conflicts(row, col):
+                e = self.entries[r][c]
+                self.highlighted.append((r, c, e.cget("bg"), e.cget("disabledbackground")))
+                e.configure(bg="#f8d7da", disabledbackground="#f8d7da")
+        return valid
+
+    def _clear_highlight(self):
+        for r, c, bg, disabled_bg in self.highlighted:
+            self.entries[r][c].configure(bg=bg, disabledbackground=disabled_bg)
+        self.highlighted = []
+
+    def _check_completion(self):
+        """Verifica si el Sudoku está completado correctamente (O(1), con los contadores del tablero)"""
+        if self.play_board is not None and self.play_board.is_complete():
+            self._show_victory()
     
     def _show_victory(self):
         """Muestra mensaje de victoria y deshabilita el tablero"""
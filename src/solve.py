@@ -0,0 +1,106 @@
+"""
+Resuelve archivos de puzzles desde la línea de comandos.
+
+Lee un puzzle de 81 caracteres por línea (formato de utils.corpus: '0' o '.' para
+las vacías, '#' para comentarios) de un archivo o de la entrada estándar, y
+escribe una línea por puzzle a medida que se resuelven: la solución de 81 dígitos
+o el estado si no se resolvió ('unsolvable', 'timeout', 'node_limit'). El orden de
+salida es el de entrada aunque se usen varios procesos, y la memoria no depende
+del tamaño del archivo. Al final se informa el rendimiento (puzzles/s) por stderr.
+
+Ejemplos:
+    python solve.py corpus/hardest.txt
+    python solve.py puzzles.txt -o soluciones.txt --engine dancing_links --workers 4
+    cat puzzles.txt | python solve.py - --engine backtracking --propagate
+    python solve.py corpus/hard17.txt --engine branch_and_bound --value-order lcv
+"""
+
+import argparse
+import os
+import sys
+from time import perf_counter
+from typing import Optional
+from utils.batch import BATCH_ENGINES, iter_solve
+from utils.corpus import iter_corpus
+from utils.ordering import VALUE_ORDERS
+from utils.solvers import SOLVERS, check_options
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Resuelve un archivo de puzzles de Sudoku (uno por línea)")
+    parser.add_argument("input", nargs="?", default="-", help="Archivo de puzzles ('-' o nada = entrada estándar)")
+    parser.add_argument("-o", "--output", default="-", help="Archivo de salida ('-' = salida estándar)")
+    parser.add_argument("--engine", default="dancing_links", choices=list(SOLVERS) + list(BATCH_ENGINES),
+                        help="Solver a usar (numpy_batch resuelve cada tanda junta; requiere NumPy)")
+    parser.add_argument("--propagate", action="store_true",
+                        help="Propagación de restricciones (backtracking y branch_and_bound)")
+    parser.add_argument("--value-order", default="natural", choices=VALUE_ORDERS,
+                        help="Orden en que se prueban los valores de cada celda (backtracking y branch_and_bound)")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos en paralelo (0 = todos los núcleos)")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="Puzzles por tanda enviada a cada proceso o resuelta junta con numpy_batch "
+                             "(por defecto 64, o 1024 con numpy_batch)")
+    parser.add_argument("--time-limit", type=float, default=None, help="Segundos máximos por puzzle")
+    parser.add_argument("-q", "--quiet", action="store_true", help="No informar el rendimiento al final")
+    args = parser.parse_args(argv)
+    args.options = {"propagate": True} if args.propagate else {}
+    if args.value_order != "natural":
+        args.options["value_order"] = args.value_order
+    if args.engine in BATCH_ENGINES:
+        if args.options:
+            parser.error(f"--propagate y --value-order no se pueden usar con {args.engine}")
+    else:
+        try:
+            check_options(args.engine, args.options)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.chunksize is None:
+        args.chunksize = 1024 if args.engine in BATCH_ENGINES else 64
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    source = sys.stdin
+    out = sys.stdout
+    counts: dict[str, int] = {}
+    start = perf_counter()
+    try:
+        if args.input != "-":
+            source = open(args.input, encoding="utf-8")
+        if args.output != "-":
+            out = open(args.output, "w", encoding="utf-8")
+        results = iter_solve(iter_corpus(source), args.engine, workers=args.workers or None,
+                             chunksize=args.chunksize, time_limit=args.time_limit, **args.options)
+        for result in results:
+            counts[result.status] = counts.get(result.status, 0) + 1
+            if result.solution is not None:
+                out.write("".join(str(v) for row in result.solution for v in row) + "\n")
+            else:
+                out.write(result.status + "\n")
+    except BrokenPipeError:
+        # La salida se cerró antes de terminar (por ejemplo '| head'): cortar sin traceback
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, ImportError) as e:
+        # Archivos que no se pueden abrir, puzzles inválidos o motor sin su dependencia
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if source is not sys.stdin:
+            source.close()
+    elapsed = perf_counter() - start
+
+    if not args.quiet:
+        total = sum(counts.values())
+        detail = ", ".join(f"{status}: {n}" for status, n in sorted(counts.items()))
+        rate = total / elapsed if elapsed > 0 else 0.0
+        print(f"{total} puzzles en {elapsed:.2f} s ({rate:,.1f} puzzles/s) · {detail or 'sin puzzles'}",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
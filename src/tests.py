@@ -1,102 +1,190 @@
-from utils.counter import reset, get_count
-from time import time
-from utils.backtracking import backtracking, iniciateBaseMatrix
-from utils.byb import branch_and_bound
-from utils.utils import makeDifficulty 
-import copy
-import pandas as pd
+import os
+from importlib.util import find_spec
+from utils.batch import BATCH_ENGINES, iter_solve
+from utils.checkpoint import Checkpoint
+from utils.corpus import generate_puzzles
+from utils.results import RunningStats, open_writer, to_excel
+from utils.solvers import check_options
 from datetime import datetime
 
 
 difficulty_levels = ["easy", "medium", "hard"]
+tests_por_dificultad = 100
+# Procesos para resolver en paralelo (None = todos los núcleos, 1 = secuencial)
+workers = None
+# Segundos máximos por puzzle: si se pasa, se registra como 'timeout' y se sigue con el próximo
+tiempo_limite = 30
+# Generar sólo puzzles con solución única (si no, se mide la primera solución encontrada)
+puzzles_unicos = True
+# Semilla de los puzzles: la misma semilla da los mismos puzzles en cada corrida y máquina
+semilla = 0
+# Archivo de resultados (.csv, .jsonl o .parquet): cada fila se escribe apenas termina su test.
+# None = resultados_sudoku_<fecha>.csv
+archivo_resultados = None
+# Checkpoint para retomar una corrida cortada: guarda los puzzles y cada test terminado. Al volver
+# a correr con la misma configuración se saltean los tests hechos (y el archivo de resultados se
+# rearma con ellos). Se borra al terminar la corrida. None = sin checkpoint.
+archivo_checkpoint = "resultados_sudoku.checkpoint.jsonl"
+# Convertir al final los resultados a Excel (requiere pandas y openpyxl; no disponible con .parquet)
+exportar_excel = True
+# Comparar los solvers con y sin propagación de restricciones
+usar_propagacion = True
+# Órdenes de valores a comparar además del natural (utils.ordering: 'lcv', 'frequency', 'random'):
+# agregan 'backtracking+<orden>' y 'branch_and_bound+<orden>' para ver cuál explora menos nodos
+ordenes_valores = ["lcv", "frequency", "random"]
+
+# nombre -> (solver en utils.solvers, opciones del solver)
 implementaciones = {
-    "backtracking": ("backtracking", backtracking),
-    "branch_and_bound": ("default", branch_and_bound)
+    "backtracking": ("backtracking", {}),
+    "branch_and_bound": ("branch_and_bound", {}),
+    "dancing_links": ("dancing_links", {}),
+    # Branch and Bound con la cola acotada (memoria acotada)
+    "branch_and_bound+cola_acotada": ("branch_and_bound", {"max_queue": 1000})
 }
+if usar_propagacion:
+    implementaciones["backtracking+propagacion"] = ("backtracking", {"propagate": True})
+    implementaciones["branch_and_bound+propagacion"] = ("branch_and_bound", {"propagate": True})
+for orden in ordenes_valores:
+    implementaciones[f"backtracking+{orden}"] = ("backtracking", {"value_order": orden})
+    implementaciones[f"branch_and_bound+{orden}"] = ("branch_and_bound", {"value_order": orden})
+# Solver vectorizado: resuelve todos los puzzles de la dificultad juntos (sólo si NumPy está instalado)
+if find_spec("numpy") is not None:
+    implementaciones["numpy_batch"] = ("numpy_batch", {})
+
+
+def _generar_puzzles():
+    # Matrices compactas (81 bytes; iter_solve arma la copia de trabajo de cada solver).
+    # Cada puzzle tiene su propia solución.
+    return {difficulty: generate_puzzles(difficulty, tests_por_dificultad, semilla, unique=puzzles_unicos)
+            for difficulty in difficulty_levels}
+
+
+def main():
+    # Opciones que el solver no acepta: fallar antes de generar puzzles
+    for algorithm, options in implementaciones.values():
+        if algorithm not in BATCH_ENGINES:
+            check_options(algorithm, options)
+
+    # Lo que tiene que coincidir para retomar un checkpoint (las implementaciones pueden cambiar)
+    config = {
+        'dificultades': difficulty_levels,
+        'tests_por_dificultad': tests_por_dificultad,
+        'semilla': semilla,
+        'puzzles_unicos': puzzles_unicos,
+        'tiempo_limite': tiempo_limite,
+    }
+    checkpoint = Checkpoint(archivo_checkpoint, config, _generar_puzzles) if archivo_checkpoint else None
+    matrices_por_dificultad = checkpoint.puzzles if checkpoint else _generar_puzzles()
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = archivo_resultados or f"resultados_sudoku_{timestamp}.csv"
+    stem = os.path.splitext(filename)[0]
+    filename_promedios = f"{stem}_promedios.csv"
+    # Los promedios son una fila por dificultad e implementación: no crecen con la cantidad de tests
+    resultados_promedios = []
+    # (dificultad, implementación) -> (tiempos, nodos)
+    estadisticas = {}
+
+    with open_writer(filename) as writer, open_writer(filename_promedios) as writer_promedios:
+        if checkpoint and checkpoint.resumed:
+            # Rearmar los resultados y los promedios de los tests ya hechos, leyendo el checkpoint de a una fila
+            hechos = 0
+            for fila in checkpoint.rows():
+                writer.write(fila)
+                tiempos, nodos = estadisticas.setdefault((fila['Dificultad'], fila['Implementación']),
+                                                         (RunningStats(), RunningStats()))
+                tiempos.add(fila['Tiempo (s)'])
+                nodos.add(fila['Nodos'])
+                hechos += 1
+            print(f"♻️  Retomando {checkpoint.path}: {hechos} tests ya terminados")
+
+        # Ejecutar tests
+        for difficulty in difficulty_levels:
+            print("\n" + "="*70)
+            print(f"DIFICULTAD: {difficulty.upper()}")
+            print("="*70)
+
+            for impl_name, (algorithm, options) in implementaciones.items():
+                print("\n" + "-"*70)
+                print(f"IMPLEMENTACIÓN: {impl_name.upper()}")
+                print("-"*70)
+
+                tiempos, nodos = estadisticas.pop((difficulty, impl_name), (RunningStats(), RunningStats()))
+                hechos = checkpoint.done(difficulty, impl_name) if checkpoint else 0
+                if hechos:
+                    print(f"Tests 1-{hechos} ya terminados (checkpoint)")
+
+                # iter_solve reparte los puzzles entre procesos y entrega los resultados en orden,
+                # a medida que terminan, sin juntarlos en memoria
+                chunksize = 1024 if algorithm in BATCH_ENGINES else 64
+                resultados = iter_solve(matrices_por_dificultad[difficulty][hechos:], algorithm, workers=workers,
+                                        chunksize=chunksize, time_limit=tiempo_limite, **options)
+
+                for i, resultado in enumerate(resultados, hechos):
+                    execution_time = resultado.time
+                    nodes = resultado.nodes
+
+                    tiempos.add(execution_time)
+                    nodos.add(nodes)
+
+                    # Guardar resultado individual
+                    fila = {
+                        'Dificultad': difficulty,
+                        'Implementación': impl_name,
+                        'Test': i + 1,
+                        'Tiempo (s)': execution_time,
+                        'Nodos': nodes,
+                        'Estado': resultado.status
+                    }
+                    if checkpoint:
+                        checkpoint.record(fila)
+                    writer.write(fila)
+
+                    print(f"Test {i+1:3d} | Tiempo: {execution_time:.6f}s | Nodos: {nodes:,} | {resultado.status}")
+
+                # Guardar promedios
+                promedio = {
+                    'Dificultad': difficulty,
+                    'Implementación': impl_name,
+                    'Tiempo Promedio (s)': tiempos.mean,
+                    'Desvío Tiempo (s)': tiempos.stdev,
+                    'Nodos Promedio': nodos.mean,
+                    'Tiempo Total (s)': tiempos.total,
+                    'Nodos Totales': int(nodos.total),
+                    'Puzzles/s': tiempos.count/tiempos.total if tiempos.total > 0 else 0.0
+                }
+                resultados_promedios.append(promedio)
+                writer_promedios.write(promedio)
+
+                print("-"*70)
+                print(f"PROMEDIOS ({impl_name.upper()}):")
+                print(f"Tiempo promedio: {tiempos.mean:.6f}s (desvío {tiempos.stdev:.6f}s)")
+                print(f"Nodos promedio: {nodos.mean:,.0f}")
+                print(f"Tiempo total: {tiempos.total:.2f}s")
+                print(f"Nodos totales: {int(nodos.total):,}")
+                print(f"Puzzles/s: {promedio['Puzzles/s']:,.1f}")
+                print("-"*70)
+
+            print("\n" + "="*70)
+
+    # La corrida terminó: el checkpoint ya no hace falta
+    if checkpoint:
+        checkpoint.remove()
+
+    print(f"\n✅ Resultados en: {writer.path}")
+    print(f"✅ Promedios en: {writer_promedios.path}")
+
+    # Excel es sólo una conversión final de lo ya escrito (pandas/openpyxl son opcionales)
+    if exportar_excel and not filename.endswith(".parquet"):
+        filename_excel = f"{stem}.xlsx"
+        try:
+            to_excel(filename, filename_excel, resultados_promedios)
+        except ImportError as e:
+            print(f"⚠️  No se exportó a Excel ({e}); instalar pandas y openpyxl")
+        else:
+            print(f"✅ Resultados exportados a: {filename_excel}")
+
 
-base_matrix = iniciateBaseMatrix()
-
-# Generar 100 matrices por dificultad
-matrices_por_dificultad = {}
-for difficulty in difficulty_levels:
-    matrices_por_dificultad[difficulty] = []
-    for i in range(100):
-        matriz = makeDifficulty(copy.deepcopy(base_matrix), difficulty)
-        matrices_por_dificultad[difficulty].append(copy.deepcopy(matriz))
-
-# Lista para almacenar todos los resultados
-todos_resultados = []
-resultados_promedios = []
-
-# Ejecutar tests
-for difficulty in difficulty_levels:
-    print("\n" + "="*70)
-    print(f"DIFICULTAD: {difficulty.upper()}")
-    print("="*70)
-    
-    for impl_name, (counter_id, impl_func) in implementaciones.items():
-        print("\n" + "-"*70)
-        print(f"IMPLEMENTACIÓN: {impl_name.upper()}")
-        print("-"*70)
-        
-        total_time = 0
-        total_nodes = 0
-        
-        for i, matriz in enumerate(matrices_por_dificultad[difficulty]):
-            reset(counter_id)
-            matrix_copy = copy.deepcopy(matriz)
-            
-            start_time = time()
-            impl_func(matrix_copy)
-            end_time = time()
-            
-            execution_time = end_time - start_time
-            nodes = get_count(counter_id)
-            
-            total_time += execution_time
-            total_nodes += nodes
-            
-            # Guardar resultado individual
-            todos_resultados.append({
-                'Dificultad': difficulty,
-                'Implementación': impl_name,
-                'Test': i + 1,
-                'Tiempo (s)': execution_time,
-                'Nodos': nodes
-            })
-            
-            print(f"Test {i+1:3d} | Tiempo: {execution_time:.6f}s | Nodos: {nodes:,}")
-        
-        # Guardar promedios
-        resultados_promedios.append({
-            'Dificultad': difficulty,
-            'Implementación': impl_name,
-            'Tiempo Promedio (s)': total_time/100,
-            'Nodos Promedio': total_nodes/100,
-            'Tiempo Total (s)': total_time,
-            'Nodos Totales': total_nodes
-        })
-        
-        print("-"*70)
-        print(f"PROMEDIOS ({impl_name.upper()}):")
-        print(f"Tiempo promedio: {total_time/100:.6f}s")
-        print(f"Nodos promedio: {total_nodes/100:,.0f}")
-        print(f"Tiempo total: {total_time:.2f}s")
-        print(f"Nodos totales: {total_nodes:,}")
-        print("-"*70)
-    
-    print("\n" + "="*70)
-
-# Crear DataFrames
-df_detallado = pd.DataFrame(todos_resultados)
-df_promedios = pd.DataFrame(resultados_promedios)
-
-# Exportar a Excel con múltiples hojas
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-filename = f"resultados_sudoku_{timestamp}.xlsx"
-
-with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-    df_detallado.to_excel(writer, sheet_name='Resultados Detallados', index=False)
-    df_promedios.to_excel(writer, sheet_name='Promedios', index=False)
-
-print(f"\n✅ Resultados exportados a: {filename}")
\ No newline at end of file
+# El guard es necesario para el pool de procesos (en Windows cada proceso reimporta este archivo)
+if __name__ == "__main__":
+    main()
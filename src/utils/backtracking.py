@@ -1,34 +1,323 @@
-from typing import Optional
-from utils.utils import generateValues, initialize_matrix, isFactible, populate_matrix
-from utils.counter import increment
+import random
+from typing import Iterator, Literal, Optional, Union
+from utils.utils import initialize_matrix, populate_matrix
+from utils.bitboard import BitBoard, as_bitboard, matrix_of
+from utils.board import Board
+from utils.budget import Budget
+from utils.counter import add
+from utils.ordering import ValueOrder, as_value_order
+from utils.propagation import propagate_constraints
+from utils.stats import SolveStats
 
 # Algoritmo Backtracking: resuelve el sudoku llenando celdas válidas y retrocediendo cuando es necesario
-def backtracking(board: list[list[int]], cell_index: int = 0) -> Optional[list[list[int]]]:
+# Acepta la matriz clásica, un Board o un BitBoard; las máscaras de bits hacen que cada chequeo sea O(1)
+# Con propagate=True aplica propagación de restricciones antes de empezar y en cada nodo
+# Las estadísticas se acumulan en stats (si no se pasa, se usa uno propio) y al final
+# los candidatos probados se suman al contador 'backtracking' de utils.counter
+# Con budget se corta con BudgetExceeded al pasarse de tiempo/nodos o si se cancela
+# value_order elige el orden en que se prueban los candidatos de cada celda (ver utils.ordering)
+def backtracking(board: Union[list[list[int]], Board, BitBoard], cell_index: int = 0, propagate: bool = False,
+                 stats: Optional[SolveStats] = None, budget: Optional[Budget] = None,
+                 value_order: Union[str, ValueOrder, None] = None) -> Optional[list[list[int]]]:
+    order = as_value_order(value_order)
+    bits = as_bitboard(board)
+    if not bits.consistent:
+        return None
+    if stats is None:
+        stats = SolveStats()
+    tried_before = stats.candidates_tried
+
+    try:
+        # Pre-solve: todo lo que se deduce sin ramificar
+        trail: list[tuple[int, int]] = []
+        if propagate:
+            ok = propagate_constraints(bits, trail)
+            stats.propagation_hits += len(trail)
+            if not ok:
+                return None
+
+        if not _backtracking_bits(bits, cell_index, propagate, stats, 0, budget, order):
+            return None
+    finally:
+        add('backtracking', stats.candidates_tried - tried_before)
+
+    # Si nos pasaron una matriz, la completamos en el lugar como antes
+    if isinstance(board, list):
+        for r in range(9):
+            board[r][:] = bits.cells[r]
+        return board
+    return bits.cells
+
+def _backtracking_bits(bits: BitBoard, cell_index: int, propagate: bool, stats: SolveStats, depth: int,
+                       budget: Optional[Budget] = None, order: Optional[ValueOrder] = None) -> bool:
     # Caso base: recorrimos todas las celdas
     if cell_index == 81:
-        return board
+        return True
 
     row, col = divmod(cell_index, 9)
 
-    # Saltar celdas ya completadas (diagonal inicial y pistas del puzzle)
-    if board[row][col] != 0:
-        return backtracking(board, cell_index + 1)
-
-    candidates = generateValues()
-    for value in candidates:
-        board[row][col] = value
-        increment('backtracking')
-        if isFactible(board, value, row, col):
-            result = backtracking(board, cell_index + 1)
-            if result is not None:  # Se encontró una solución válida aguas abajo
-                return result
-        # Retroceder si no funcionó
-        board[row][col] = 0
-    return None  # Ningún candidato funcionó en esta celda
+    # Saltar celdas ya completadas (diagonal inicial, pistas y valores propagados)
+    if bits.cells[row][col] != 0:
+        return _backtracking_bits(bits, cell_index + 1, propagate, stats, depth, budget, order)
+
+    stats.nodes_expanded += 1
+    depth += 1
+    if depth > stats.max_depth:
+        stats.max_depth = depth
+
+    # Sólo probamos los candidatos que las máscaras permiten (en orden natural si no hay estrategia)
+    values = bits.candidates(row, col) if order is None else order.bitboard_values(bits, row, col)
+    for value in values:
+        bits.place(value, row, col)
+        stats.candidates_tried += 1
+        if budget is not None and stats.candidates_tried >= budget.next_check:
+            budget.check(stats)
+        trail: list[tuple[int, int]] = []
+        if propagate:
+            ok = propagate_constraints(bits, trail)
+            stats.propagation_hits += len(trail)
+        else:
+            ok = True
+        if ok and _backtracking_bits(bits, cell_index + 1, propagate, stats, depth, budget, order):  # Se encontró una solución válida aguas abajo
+            return True
+        # Retroceder si no funcionó (incluye lo que haya colocado la propagación)
+        for r, c in reversed(trail):
+            bits.remove(r, c)
+        bits.remove(row, col)
+        stats.backtracks += 1
+    return False  # Ningún candidato funcionó en esta celda
+
+# Versión generadora: recorre el mismo árbol pero en vez de cortar en la primera
+# solución la entrega con yield y sigue buscando. La matriz que se entrega es el
+# tablero de trabajo (no una copia): sólo es válida hasta pedir la siguiente solución
+def iter_backtracking(board: Union[list[list[int]], Board, BitBoard], stats: Optional[SolveStats] = None) -> Iterator[list[list[int]]]:
+    bits = BitBoard(matrix_of(board))
+    if not bits.consistent:
+        return
+    if stats is None:
+        stats = SolveStats()
+    yield from _iter_backtracking_bits(bits, bits.empty_cells(), 0, stats)
+
+def _iter_backtracking_bits(bits: BitBoard, empties: list[tuple[int, int]], k: int, stats: SolveStats) -> Iterator[list[list[int]]]:
+    if k == len(empties):
+        yield bits.cells
+        return
+
+    row, col = empties[k]
+    stats.nodes_expanded += 1
+    if k + 1 > stats.max_depth:
+        stats.max_depth = k + 1
+
+    for value in bits.candidates(row, col):
+        bits.place(value, row, col)
+        stats.candidates_tried += 1
+        yield from _iter_backtracking_bits(bits, empties, k + 1, stats)
+        bits.remove(row, col)
+        stats.backtracks += 1
+
+Status = Literal['running', 'solved', 'failed']
+Step = tuple[int, int, int, str]  # (fila, columna, valor, 'try' | 'backtrack' | 'success')
+
+class BacktrackingSolver:
+    """
+    Backtracking iterativo con una pila explícita, en el mismo orden que backtracking()
+    (celdas vacías fila por fila, candidatos de menor a mayor).
+
+    No usa recursión: la pila sólo tiene un frame por celda VACÍA, así que no se paga
+    una llamada por cada celda ya completada. Se puede avanzar de a un paso (step),
+    correr con un presupuesto de pasos (run) y reanudar, o guardar el estado
+    (checkpoint) para restaurarlo más tarde (restore).
+
+    Attributes:
+        bits: Tablero de trabajo
+        empties: Celdas vacías del puzzle original, en orden fila por fila
+        stack: Un frame [fila, columna, candidatos, próximo índice] por celda abierta
+        status: 'running', 'solved' (bits tiene la solución) o 'failed' (no hay solución)
+        stats: Estadísticas de la resolución
+    """
+
+    def __init__(self, board: Union[list[list[int]], Board, BitBoard], stats: Optional[SolveStats] = None):
+        self.bits = BitBoard(matrix_of(board))
+        self.empties = self.bits.empty_cells()
+        self.stack: list[list] = []
+        self.stats = stats if stats is not None else SolveStats()
+        self.status: Status = 'running' if self.bits.consistent else 'failed'
+        # True cuando hay que abrir un frame para la próxima celda vacía
+        self._descend = True
+
+    def step(self) -> Optional[Step]:
+        """
+        Avanza un paso: prueba el próximo candidato de la celda actual o retrocede.
+
+        Returns:
+            Optional[Step]: El paso realizado, o None si la búsqueda ya terminó
+        """
+        if self.status != 'running':
+            return None
+        bits, stack, stats = self.bits, self.stack, self.stats
+
+        if self._descend:
+            depth = len(stack)
+            if depth == len(self.empties):
+                self.status = 'solved'
+                return None
+            row, col = self.empties[depth]
+            stack.append([row, col, bits.candidates(row, col), 0])
+            stats.nodes_expanded += 1
+            if depth + 1 > stats.max_depth:
+                stats.max_depth = depth + 1
+
+        frame = stack[-1]
+        row, col, candidates, i = frame
+        if bits.cells[row][col] != 0:
+            # Deshacer el candidato anterior de esta celda
+            bits.remove(row, col)
+            stats.backtracks += 1
+
+        if i < len(candidates):
+            value = candidates[i]
+            frame[3] = i + 1
+            bits.place(value, row, col)
+            stats.candidates_tried += 1
+            self._descend = True
+            return (row, col, candidates[i], 'try')
+
+        # Ningún candidato funcionó: volver a la celda anterior
+        stack.pop()
+        self._descend = False
+        if not stack:
+            self.status = 'failed'
+        return (row, col, 0, 'backtrack')
+
+    def run(self, max_steps: Optional[int] = None) -> Status:
+        """
+        Avanza hasta terminar o hasta hacer max_steps pasos (después se puede seguir).
+
+        Es el mismo algoritmo que step() pero con el loop desenrollado y variables
+        locales, para no pagar una llamada a método por cada paso.
+        """
+        if self.status != 'running':
+            return self.status
+        bits, stack, stats, empties = self.bits, self.stack, self.stats, self.empties
+        cells, place, remove, candidates_of = bits.cells, bits.place, bits.remove, bits.candidates
+        total = len(empties)
+        descend = self._descend
+        remaining = -1 if max_steps is None else max_steps
+        nodes = tried = backtracks = 0
+        max_depth = stats.max_depth
+
+        while remaining != 0:
+            if descend:
+                depth = len(stack)
+                if depth == total:
+                    self.status = 'solved'
+                    break
+                row, col = empties[depth]
+                frame = [row, col, candidates_of(row, col), 0]
+                stack.append(frame)
+                nodes += 1
+                if depth + 1 > max_depth:
+                    max_depth = depth + 1
+            else:
+                frame = stack[-1]
+
+            row, col, candidates, i = frame
+            if cells[row][col] != 0:
+                remove(row, col)
+                backtracks += 1
+            if i < len(candidates):
+                frame[3] = i + 1
+                place(candidates[i], row, col)
+                tried += 1
+                descend = True
+            else:
+                stack.pop()
+                descend = False
+                if not stack:
+                    self.status = 'failed'
+                    break
+            remaining -= 1
+
+        # Un presupuesto justo hasta el último candidato deja el tablero completo
+        if self.status == 'running' and descend and len(stack) == total:
+            self.status = 'solved'
+
+        self._descend = descend
+        stats.nodes_expanded += nodes
+        stats.candidates_tried += tried
+        stats.backtracks += backtracks
+        stats.max_depth = max_depth
+        return self.status
+
+    def steps(self) -> Iterator[Step]:
+        """
+        Entrega los pasos de a uno a medida que se ejecutan (para animar la búsqueda).
+
+        No guarda nada aparte de la pila del solver, así que la memoria es O(profundidad)
+        aunque la búsqueda haga millones de pasos. Al resolver entrega además un paso
+        'success' por cada celda que completó el solver.
+        """
+        step = self.step
+        while True:
+            event = step()
+            if event is None:
+                break
+            yield event
+        if self.status == 'solved':
+            cells = self.bits.cells
+            for row, col in self.empties:
+                yield (row, col, cells[row][col], 'success')
+
+    def solution(self) -> Optional[list[list[int]]]:
+        return self.bits.to_matrix() if self.status == 'solved' else None
+
+    def checkpoint(self) -> tuple:
+        """Estado serializable (pickle) para reanudar la búsqueda más tarde."""
+        grid = Board.from_matrix(self.bits.cells).snapshot()
+        frames = tuple(tuple(frame) for frame in self.stack)
+        return (grid, frames, self._descend, self.status, self.stats.as_dict())
+
+    def restore(self, checkpoint: tuple):
+        """Vuelve al estado guardado con checkpoint() (del mismo puzzle)."""
+        grid, frames, descend, status, stats = checkpoint
+        self.bits = BitBoard(Board(grid))
+        self.stack = [list(frame) for frame in frames]
+        self._descend = descend
+        self.status = status
+        for name, value in stats.items():
+            setattr(self.stats, name, value)
+
+def iter_backtracking_steps(board: Union[list[list[int]], Board, BitBoard],
+                            stats: Optional[SolveStats] = None) -> Iterator[Step]:
+    """Pasos (try/backtrack/success) del backtracking, generados a medida que se piden."""
+    return BacktrackingSolver(board, stats).steps()
+
+# Variante iterativa de backtracking() (mismo orden de búsqueda y mismos nodos)
+# Con budget corre de a tramos y chequea el presupuesto entre tramos
+def backtracking_iterative(board: Union[list[list[int]], Board, BitBoard], stats: Optional[SolveStats] = None,
+                           budget: Optional[Budget] = None) -> Optional[list[list[int]]]:
+    solver = BacktrackingSolver(board, stats)
+    tried_before = solver.stats.candidates_tried
+    try:
+        if budget is None:
+            solver.run()
+        else:
+            while solver.status == 'running':
+                budget.check(solver.stats)
+                solver.run(budget.next_check - solver.stats.candidates_tried)
+    finally:
+        add('backtracking', solver.stats.candidates_tried - tried_before)
+    solution = solver.solution()
+    if solution is not None and isinstance(board, list):
+        for r in range(9):
+            board[r][:] = solution[r]
+        return board
+    return solution
 
 # Genera un sudoku resuelto a partir de la diagonal aleatoria
-def iniciateBaseMatrix() -> list[list[int]]:
+# rng: random.Random con semilla para generar siempre la misma matriz (None = random global)
+def iniciateBaseMatrix(rng: Optional[random.Random] = None) -> list[list[int]]:
     base_matrix = initialize_matrix()
-    base_matrix = populate_matrix(base_matrix)
+    base_matrix = populate_matrix(base_matrix, rng)
     base_matrix = backtracking(base_matrix)
-    return base_matrix 
\ No newline at end of file
+    return base_matrix 
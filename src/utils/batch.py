@@ -0,0 +1,191 @@
+"""
+Resolución de muchos puzzles en paralelo con un pool de procesos.
+
+Cada tarea le pasa al solver su propio SolveStats, así que los nodos reportados
+son los de ese puzzle aunque corran varios a la vez (no se usa utils.counter).
+
+iter_solve es la versión perezosa para archivos enormes: va leyendo los puzzles a
+medida que hace falta y entrega los resultados en orden, con memoria acotada.
+
+El motor 'numpy_batch' (utils.vectorized, requiere NumPy) no es un solver de a
+un puzzle: solve_many e iter_solve le pasan el lote (o cada tanda) entero.
+
+Con time_limit / max_nodes cada puzzle tiene su presupuesto: si se excede, el
+resultado vuelve con status 'timeout' o 'node_limit' y las estadísticas parciales
+en lugar de frenar todo el lote.
+"""
+
+import os
+from collections import deque
+from functools import partial
+from itertools import islice
+from time import perf_counter
+from typing import Iterable, Iterator, Literal, NamedTuple, Optional, Union
+from utils.board import Board
+from utils.budget import Budget, BudgetExceeded, CancellationToken
+from utils.stats import SolveStats
+from utils.solvers import get_solver
+
+
+# Motores que resuelven un lote entero de una vez (no están en utils.solvers)
+BATCH_ENGINES = ("numpy_batch",)
+
+Status = Literal['solved', 'unsolvable', 'timeout', 'node_limit', 'cancelled']
+
+
+class SolveResult(NamedTuple):
+    solution: Optional[list[list[int]]]
+    time: float   # segundos
+    nodes: int    # candidatos probados, igual que los contadores de utils.counter
+    stats: SolveStats
+    status: Status = 'solved'
+
+
+def solve_one(
+    puzzle: Union[list[list[int]], Board],
+    algorithm: str,
+    time_limit: Optional[float] = None,
+    max_nodes: Optional[int] = None,
+    token: Optional[CancellationToken] = None,
+    stats: Optional[SolveStats] = None,
+    **options,
+) -> SolveResult:
+    """
+    Resuelve un puzzle midiendo tiempo y nodos, respetando el presupuesto.
+
+    Args:
+        puzzle: Matriz 9x9 o Board (no se modifica)
+        algorithm: Nombre del solver en utils.solvers.SOLVERS
+        time_limit: Segundos máximos para este puzzle (None = sin límite)
+        max_nodes: Candidatos probados máximos (None = sin límite)
+        token: Token para cancelar la resolución desde otro hilo
+        stats: SolveStats a usar (sirve para leer el progreso desde otro hilo)
+        **options: Argumentos extra para el solver
+    """
+    _, solver = get_solver(algorithm)
+    # Copia de trabajo: el solver completa la matriz en el lugar
+    board = puzzle.to_matrix() if isinstance(puzzle, Board) else [row[:] for row in puzzle]
+    if stats is None:
+        stats = SolveStats()
+    if time_limit is not None or max_nodes is not None or token is not None:
+        options['budget'] = Budget(time_limit, max_nodes, token)
+
+    start = perf_counter()
+    try:
+        solution = solver(board, stats=stats, **options)
+    except BudgetExceeded as exceeded:
+        elapsed = perf_counter() - start
+        return SolveResult(None, elapsed, stats.candidates_tried, stats, exceeded.reason)
+    elapsed = perf_counter() - start
+    status = 'solved' if solution is not None else 'unsolvable'
+    return SolveResult(solution, elapsed, stats.candidates_tried, stats, status)
+
+
+def solve_many(
+    puzzles: Iterable[Union[list[list[int]], Board]],
+    algorithm: str,
+    workers: Optional[int] = None,
+    chunksize: int = 4,
+    time_limit: Optional[float] = None,
+    max_nodes: Optional[int] = None,
+    **options,
+) -> list[SolveResult]:
+    """
+    Resuelve una lista de puzzles repartiéndolos en un pool de procesos.
+
+    Args:
+        puzzles: Matrices 9x9 con 0 en celdas vacías o Boards (no se modifican)
+        algorithm: Nombre del solver en utils.solvers.SOLVERS
+        workers: Cantidad de procesos (None = todos los núcleos, 1 = sin pool)
+        chunksize: Puzzles que se mandan juntos a cada proceso
+        time_limit: Segundos máximos por puzzle (None = sin límite)
+        max_nodes: Candidatos probados máximos por puzzle (None = sin límite)
+        **options: Argumentos extra para el solver (por ejemplo propagate=True)
+
+    Returns:
+        list[SolveResult]: Un resultado por puzzle, en el mismo orden de entrada
+    """
+    if algorithm in BATCH_ENGINES:
+        return _solve_batch(list(puzzles), time_limit=time_limit, max_nodes=max_nodes, **options)
+    get_solver(algorithm)  # fallar acá y no dentro de cada proceso
+    task = partial(solve_one, algorithm=algorithm, time_limit=time_limit, max_nodes=max_nodes, **options)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        return [task(puzzle) for puzzle in puzzles]
+
+    # El pool (multiprocessing) se importa sólo si hace falta: demora el arranque ~20 ms
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(task, puzzles, chunksize=chunksize))
+
+
+def _solve_batch(puzzles: list[Union[list[list[int]], Board]], **options) -> list[SolveResult]:
+    """Motor 'numpy_batch': NumPy se importa recién acá, así que sin NumPy sólo falla este motor."""
+    try:
+        from utils.vectorized import solve_batch
+    except ImportError as e:
+        raise ImportError("El motor 'numpy_batch' necesita NumPy (pip install numpy)") from e
+    return solve_batch(puzzles, **options)
+
+
+def _solve_chunk(chunk: list[Union[list[list[int]], Board]], algorithm: str, **kwargs) -> list[SolveResult]:
+    if algorithm in BATCH_ENGINES:
+        return _solve_batch(chunk, **kwargs)
+    return [solve_one(puzzle, algorithm, **kwargs) for puzzle in chunk]
+
+
+def iter_solve(
+    puzzles: Iterable[Union[list[list[int]], Board]],
+    algorithm: str,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    time_limit: Optional[float] = None,
+    max_nodes: Optional[int] = None,
+    **options,
+) -> Iterator[SolveResult]:
+    """
+    Como solve_many pero perezoso: lee los puzzles a medida que hace falta y entrega
+    cada resultado apenas está listo, en el mismo orden de entrada.
+
+    A diferencia de pool.map, no consume toda la entrada de una vez: hay a lo sumo
+    2 * workers tandas de chunksize puzzles en vuelo, así que la memoria no depende
+    de la cantidad de puzzles.
+
+    Args:
+        puzzles: Cualquier iterable (por ejemplo utils.corpus.iter_corpus de un archivo)
+        chunksize: Puzzles por tanda que se manda a un proceso
+        (el resto como en solve_many)
+
+    Yields:
+        SolveResult: Un resultado por puzzle, en orden
+    """
+    if algorithm not in BATCH_ENGINES:
+        get_solver(algorithm)  # fallar acá y no dentro de cada proceso
+    kwargs = dict(options, time_limit=time_limit, max_nodes=max_nodes)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    puzzles = iter(puzzles)
+    if workers <= 1:
+        if algorithm in BATCH_ENGINES:
+            while chunk := list(islice(puzzles, chunksize)):
+                yield from _solve_chunk(chunk, algorithm, **kwargs)
+        else:
+            for puzzle in puzzles:
+                yield solve_one(puzzle, algorithm, **kwargs)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while True:
+            chunk = list(islice(puzzles, chunksize))
+            if not chunk:
+                break
+            pending.append(pool.submit(_solve_chunk, chunk, algorithm, **kwargs))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
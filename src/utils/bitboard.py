@@ -0,0 +1,140 @@
+"""
+Tablero con máscaras de bits por fila, columna y cuadrante.
+
+Cada fila, columna y cuadrante guarda una máscara de 9 bits donde el bit (v - 1)
+indica que el valor v ya está usado. Las máscaras se actualizan de forma
+incremental al colocar/quitar un valor, así que chequear si un valor es factible
+o enumerar los candidatos de una celda son operaciones de bits O(1), en lugar de
+recorrer fila, columna y cuadrante como hace isFactible.
+"""
+
+from typing import Union
+from utils.board import Board
+from utils.indices import BOX_OF
+
+FULL_MASK = 0x1FF  # los 9 valores usados
+
+# BIT[v] es la máscara del valor v (BIT[0] = 0 para que las celdas vacías no sumen)
+BIT = [0] + [1 << (v - 1) for v in range(1, 10)]
+
+# Tablas precalculadas para las 512 máscaras posibles
+MASK_VALUES: list[tuple[int, ...]] = [
+    tuple(v for v in range(1, 10) if mask & BIT[v]) for mask in range(FULL_MASK + 1)
+]
+POPCOUNT: list[int] = [len(values) for values in MASK_VALUES]
+
+
+class BitBoard:
+    """
+    Tablero 9x9 con máscaras de ocupación por fila, columna y cuadrante.
+
+    Attributes:
+        cells: Valores del tablero (0 en celdas vacías)
+        rows: Máscara de valores usados en cada fila
+        cols: Máscara de valores usados en cada columna
+        boxes: Máscara de valores usados en cada cuadrante
+        consistent: False si las pistas iniciales repiten algún valor
+    """
+
+    __slots__ = ('cells', 'rows', 'cols', 'boxes', 'consistent')
+
+    def __init__(self, matrix: Union[list[list[int]], Board]):
+        self.cells = matrix.to_matrix() if isinstance(matrix, Board) else [row[:] for row in matrix]
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+        self.consistent = True
+
+        for r in range(9):
+            for c in range(9):
+                v = self.cells[r][c]
+                if v != 0:
+                    if not self.is_factible(v, r, c):
+                        self.consistent = False
+                    self._set_bits(v, r, c)
+
+    def copy(self) -> 'BitBoard':
+        """Copia el tablero y sus máscaras sin volver a recorrer las 81 celdas."""
+        clone = BitBoard.__new__(BitBoard)
+        clone.cells = [row[:] for row in self.cells]
+        clone.rows = self.rows[:]
+        clone.cols = self.cols[:]
+        clone.boxes = self.boxes[:]
+        clone.consistent = self.consistent
+        return clone
+
+    @classmethod
+    def from_masks(cls, cells: list[list[int]], rows: list[int], cols: list[int], boxes: list[int]) -> 'BitBoard':
+        """Arma el tablero con máscaras ya conocidas (consistentes con cells), sin recorrer las celdas."""
+        bits = cls.__new__(cls)
+        bits.cells = cells
+        bits.rows = rows
+        bits.cols = cols
+        bits.boxes = boxes
+        bits.consistent = True
+        return bits
+
+    def _set_bits(self, v: int, row: int, col: int):
+        bit = BIT[v]
+        self.rows[row] |= bit
+        self.cols[col] |= bit
+        self.boxes[BOX_OF[row][col]] |= bit
+
+    def place(self, v: int, row: int, col: int):
+        """Coloca v en (row, col) actualizando las máscaras. La celda debe estar vacía."""
+        self.cells[row][col] = v
+        self._set_bits(v, row, col)
+
+    def remove(self, row: int, col: int):
+        """Vacía la celda (row, col) y libera su valor en las máscaras."""
+        clear = ~BIT[self.cells[row][col]]
+        self.cells[row][col] = 0
+        self.rows[row] &= clear
+        self.cols[col] &= clear
+        self.boxes[BOX_OF[row][col]] &= clear
+
+    def unit_mask(self, unit: int) -> int:
+        """Máscara de valores usados en la unidad (índice de UNITS)."""
+        if unit < 9:
+            return self.rows[unit]
+        if unit < 18:
+            return self.cols[unit - 9]
+        return self.boxes[unit - 18]
+
+    def used_mask(self, row: int, col: int) -> int:
+        """Máscara de valores que ya aparecen en la fila, columna o cuadrante de la celda."""
+        return self.rows[row] | self.cols[col] | self.boxes[BOX_OF[row][col]]
+
+    def candidates_mask(self, row: int, col: int) -> int:
+        """Máscara de valores que se pueden colocar en la celda."""
+        return ~self.used_mask(row, col) & FULL_MASK
+
+    def candidates(self, row: int, col: int) -> tuple[int, ...]:
+        """Valores que se pueden colocar en la celda, en orden creciente."""
+        return MASK_VALUES[self.candidates_mask(row, col)]
+
+    def is_factible(self, v: int, row: int, col: int) -> bool:
+        """Equivalente a isFactible para una celda vacía, pero en O(1)."""
+        return not (self.used_mask(row, col) & BIT[v])
+
+    def empty_cells(self) -> list[tuple[int, int]]:
+        return [(r, c) for r in range(9) for c in range(9) if self.cells[r][c] == 0]
+
+    def to_matrix(self) -> list[list[int]]:
+        return [row[:] for row in self.cells]
+
+
+def as_bitboard(board: Union[list[list[int]], Board, BitBoard]) -> BitBoard:
+    """Acepta la matriz clásica, un Board o un BitBoard ya construido."""
+    if isinstance(board, BitBoard):
+        return board
+    return BitBoard(board)
+
+
+def matrix_of(board: Union[list[list[int]], Board, BitBoard]) -> list[list[int]]:
+    """Matriz de cualquiera de los tres formatos (la de BitBoard y la lista no se copian)."""
+    if isinstance(board, BitBoard):
+        return board.cells
+    if isinstance(board, Board):
+        return board.to_matrix()
+    return board
@@ -0,0 +1,73 @@
+"""
+Tablero compacto: las 81 celdas en un bytearray plano (un byte por celda).
+
+Ocupa ~140 bytes contra ~1.3 KB de una matriz list[list[int]], y copiarlo,
+tomar un snapshot o restaurarlo son copias de 81 bytes hechas en C. Se convierte
+desde y hacia la matriz clásica y el formato de texto de 81 caracteres.
+"""
+
+from typing import Union
+from utils.indices import INDEX
+
+EMPTY_CHARS = "0."
+
+
+class Board:
+    """
+    Attributes:
+        grid: Valores de las 81 celdas en orden fila por fila (0 = vacía)
+    """
+
+    __slots__ = ('grid',)
+
+    def __init__(self, grid: Union[bytes, bytearray, None] = None):
+        self.grid = bytearray(grid) if grid is not None else bytearray(81)
+        if len(self.grid) != 81:
+            raise ValueError(f"Un tablero tiene 81 celdas, no {len(self.grid)}")
+
+    @classmethod
+    def from_matrix(cls, matrix: list[list[int]]) -> 'Board':
+        return cls(bytes(v for row in matrix for v in row))
+
+    @classmethod
+    def from_string(cls, text: str) -> 'Board':
+        """Lee 81 caracteres: dígitos 1-9 y '0' o '.' para las celdas vacías."""
+        text = text.strip()
+        if len(text) != 81:
+            raise ValueError(f"Se esperaban 81 caracteres, llegaron {len(text)}")
+        try:
+            return cls(bytes(0 if ch in EMPTY_CHARS else int(ch) for ch in text))
+        except ValueError:
+            raise ValueError(f"Caracter inválido en el puzzle: {text!r}") from None
+
+    def to_matrix(self) -> list[list[int]]:
+        grid = self.grid
+        return [list(grid[r * 9:r * 9 + 9]) for r in range(9)]
+
+    def to_string(self, empty: str = "0") -> str:
+        return "".join(str(v) if v else empty for v in self.grid)
+
+    def get(self, row: int, col: int) -> int:
+        return self.grid[INDEX[row][col]]
+
+    def set(self, row: int, col: int, value: int):
+        self.grid[INDEX[row][col]] = value
+
+    def copy(self) -> 'Board':
+        return Board(self.grid)
+
+    def snapshot(self) -> bytes:
+        """Foto inmutable del tablero para restaurarla más tarde."""
+        return bytes(self.grid)
+
+    def restore(self, snapshot: bytes):
+        self.grid[:] = snapshot
+
+    def empty_count(self) -> int:
+        return self.grid.count(0)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Board) and self.grid == other.grid
+
+    def __repr__(self) -> str:
+        return f"Board({self.to_string()!r})"
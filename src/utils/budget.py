@@ -0,0 +1,82 @@
+"""
+Presupuestos por resolución: tiempo límite, máximo de nodos y cancelación cooperativa.
+
+Los solvers reciben un Budget opcional y lo consultan cada tanto (no en cada nodo,
+para no frenar el loop principal). Si se excede, lanzan BudgetExceeded con el
+motivo y las estadísticas parciales; utils.batch lo convierte en un resultado
+con status 'timeout', 'node_limit' o 'cancelled'.
+"""
+
+import threading
+from time import perf_counter
+from typing import Literal, Optional
+from utils.stats import SolveStats
+
+Reason = Literal['timeout', 'node_limit', 'cancelled']
+
+# Cada cuántos candidatos probados se mira el reloj y el token
+CHECK_INTERVAL = 256
+
+
+class CancellationToken:
+    """Bandera que otro hilo (por ejemplo la GUI) activa para pedir que el solver se detenga."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class BudgetExceeded(Exception):
+    """
+    Attributes:
+        reason: 'timeout', 'node_limit' o 'cancelled'
+        stats: Estadísticas de la resolución hasta el momento de cortar
+    """
+
+    def __init__(self, reason: Reason, stats: SolveStats):
+        super().__init__(reason)
+        self.reason = reason
+        self.stats = stats
+
+
+class Budget:
+    """
+    Límites de una resolución.
+
+    Attributes:
+        deadline: Instante (perf_counter) a partir del cual se corta, o None
+        max_nodes: Máximo de candidatos probados (se corta al intentar uno más), o None
+        token: Token de cancelación, o None
+        next_check: Cantidad de candidatos probados en la que toca volver a chequear
+    """
+
+    __slots__ = ('deadline', 'max_nodes', 'token', 'next_check')
+
+    def __init__(self, time_limit: Optional[float] = None, max_nodes: Optional[int] = None,
+                 token: Optional[CancellationToken] = None, deadline: Optional[float] = None):
+        if time_limit is not None:
+            deadline = perf_counter() + time_limit if deadline is None else min(deadline, perf_counter() + time_limit)
+        self.deadline = deadline
+        self.max_nodes = max_nodes
+        self.token = token
+        self.next_check = 0
+
+    def check(self, stats: SolveStats):
+        """Lanza BudgetExceeded si se pasó algún límite; si no, agenda el próximo chequeo."""
+        tried = stats.candidates_tried
+        if self.token is not None and self.token.cancelled:
+            raise BudgetExceeded('cancelled', stats)
+        if self.max_nodes is not None and tried > self.max_nodes:
+            raise BudgetExceeded('node_limit', stats)
+        if self.deadline is not None and perf_counter() >= self.deadline:
+            raise BudgetExceeded('timeout', stats)
+
+        self.next_check = tried + CHECK_INTERVAL
+        if self.max_nodes is not None:
+            self.next_check = min(self.next_check, self.max_nodes + 1)
@@ -1,12 +1,26 @@
 """
-Heurística: Most Constrained Variable (MCV) implementada con heap
+Heurística: Most Constrained Variable (MCV), la celda vacía con menos opciones
 Cota Inferior: Mínimo de opciones disponibles en cualquier celda vacía
 Cota Superior: Máximo de opciones disponibles en cualquier celda vacía
+
+Los nodos guardan el tablero y los candidatos en arrays planos de 81 posiciones
+(Board y array('H')) con __slots__, porque la cola de prioridad puede tener
+cientos de miles de nodos vivos a la vez.
 """
 
-from typing import Set, Tuple, Optional, List
-from utils.counter import increment
+from array import array
+from typing import Generator, Iterator, Set, Tuple, Optional, List, Union
+from utils.backtracking import Step
+from utils.counter import add
+from utils.bitboard import BIT, MASK_VALUES, POPCOUNT, BitBoard, matrix_of
+from utils.board import Board
+from utils.budget import Budget
+from utils.indices import BOX_OF, CELL_POS, INDEX, PEER_INDICES
+from utils.ordering import ValueOrder, as_value_order
+from utils.propagation import propagate_constraints
+from utils.stats import SolveStats
 import heapq
+import sys
 
 
 class SudokuNode:
@@ -14,108 +28,182 @@ class SudokuNode:
     Representa un nodo en el árbol de búsqueda de Branch and Bound
     
     Attributes:
-        matrix: Estado actual del tablero (9x9)
+        board: Estado actual del tablero (81 bytes)
         depth: Profundidad del nodo en el árbol
-        cells_heap: Cola de prioridad de celdas vacías (ordenadas por MCV)
+        options: Máscara de candidatos de cada celda (sólo tiene sentido en las vacías)
+        size_count: Cantidad de celdas vacías con 0..9 opciones (para las cotas)
         lower_bound: Mínimo de opciones en alguna celda vacía
         upper_bound: Máximo de opciones en alguna celda vacía
+        propagate: Si se aplica propagación de restricciones en cada nodo
+        propagated: Celdas que completó la propagación al crear este nodo
+        units: Con propagate, máscara de valores usados de cada fila (0-8), columna (9-17)
+            y cuadrante (18-26), derivada del padre; None sin propagación
     """
     
-    def __init__(self, matrix: list[list[int]], depth: int = 0):
-        self.matrix = [row[:] for row in matrix]
+    __slots__ = ('board', 'depth', 'options', 'size_count', 'lower_bound', 'upper_bound', 'propagate', 'propagated',
+                 'units')
+    
+    def __init__(self, matrix: Union[list[list[int]], Board, BitBoard], depth: int = 0, propagate: bool = False):
+        bits = BitBoard(matrix_of(matrix))
+        self.board = Board.from_matrix(bits.cells)
         self.depth = depth
-        self.cells_heap: List[Tuple[int, int, int, Set[int]]] = []
+        self.propagate = propagate
+        self.propagated = 0
+        self.options = array('H', bytes(162))
+        self.size_count = bytearray(10)
         self.lower_bound = float('inf')
         self.upper_bound = 0
-        self._build_cells_heap()
+        self.units = array('H', bits.rows + bits.cols + bits.boxes) if propagate else None
+        self._build_options(bits)
+    
+    @property
+    def matrix(self) -> list[list[int]]:
+        """Tablero como matriz 9x9 (se arma en cada llamada)."""
+        return self.board.to_matrix()
         
-    def _build_cells_heap(self):
+    def _build_options(self, bits: BitBoard):
         """
-        Construye la cola de prioridad de celdas vacías.
-        
-          construimos un heap UNA VEZ con todas las celdas vacías
-        - El heap mantiene automáticamente las celdas ordenadas por MCV
-        
-        Heap contiene tuplas: (num_opciones, row, col, opciones_disponibles)
-        Ordenado automáticamente por num_opciones (menor primero)
+        Calcula los candidatos de todas las celdas vacías del nodo raíz.
         
-        También calcula las cotas mientras construye el heap.
+        Sólo el nodo raíz recorre las 81 celdas; los hijos se derivan con child().
+        También calcula las cotas.
         """
-        counter = 0
-        min_options = float('inf')
-        max_options = 0
-        
-        for i in range(9):
-            for j in range(9):
-                if self.matrix[i][j] == 0:
-                    options = self._get_available_values(i, j)
-                    num_options = len(options)
-                    
-                    if num_options == 0:
-                        # Estado inválido
-                        self.lower_bound = float('inf')
-                        self.upper_bound = float('inf')
-                        self.cells_heap = []
-                        return
-                    
-                    # Actualizar cotas
-                    min_options = min(min_options, num_options)
-                    max_options = max(max_options, num_options)
-                    
-                    # Agregar celda al heap
-                    # (num_opciones, row, col, counter, opciones)
-                    heapq.heappush(self.cells_heap, (num_options, i, j, counter, options))
-                    counter += 1
+        if not bits.consistent:
+            # Pistas repetidas: el nodo no tiene solución
+            self.size_count[0] = 1
+            self._update_bounds()
+            return
+        
+        grid = self.board.grid
+        for i in range(81):
+            if grid[i] == 0:
+                mask = bits.candidates_mask(*CELL_POS[i])
+                self.options[i] = mask
+                self.size_count[POPCOUNT[mask]] += 1
         
-        # Establecer cotas
-        if not self.cells_heap:
+        self._update_bounds()
+        if self.propagate and self.lower_bound != float('inf'):
+            self._propagate()
+    
+    def _propagate(self):
+        """Aplica propagación sobre los candidatos del nodo y recalcula las cotas."""
+        grid = self.board.grid
+        # Las máscaras de las unidades vienen del padre: no hace falta recorrer el tablero para armarlas
+        units = self.units
+        bits = BitBoard.from_masks(self.board.to_matrix(), list(units[:9]), list(units[9:18]), list(units[18:]))
+        candidates = {CELL_POS[i]: self.options[i] for i in range(81) if grid[i] == 0}
+        trail: List[Tuple[int, int]] = []
+        ok = propagate_constraints(bits, trail, candidates)
+        self.propagated = len(trail)
+        if ok:
+            for row, col in trail:
+                grid[INDEX[row][col]] = bits.cells[row][col]
+                self.options[INDEX[row][col]] = 0
+            self.units = array('H', bits.rows + bits.cols + bits.boxes)
+            self.size_count = bytearray(10)
+            for (row, col), mask in candidates.items():
+                self.options[INDEX[row][col]] = mask
+                self.size_count[POPCOUNT[mask]] += 1
+        else:
+            # Contradicción: el nodo no tiene solución
+            self.size_count[0] = 1
+        self._update_bounds()
+    
+    def _update_bounds(self):
+        """Calcula las cotas a partir del histograma de opciones (O(10))."""
+        if self.size_count[0]:
+            # Estado inválido: alguna celda vacía se quedó sin opciones
+            self.lower_bound = float('inf')
+            self.upper_bound = float('inf')
+        elif not any(self.size_count):
             # No hay celdas vacías (sudoku resuelto)
             self.lower_bound = 0
             self.upper_bound = 0
         else:
-            self.lower_bound = min_options
-            self.upper_bound = max_options
+            sizes = [n for n in range(1, 10) if self.size_count[n]]
+            self.lower_bound = sizes[0]
+            self.upper_bound = sizes[-1]
     
-    def _get_available_values(self, row: int, col: int) -> Set[int]:
-        """Calcula los valores disponibles para una celda específica."""
-        if self.matrix[row][col] != 0:
-            return set()
-        
-        all_values = {1, 2, 3, 4, 5, 6, 7, 8, 9}
+    def child(self, row: int, col: int, value: int) -> 'SudokuNode':
+        """
+        Crea el hijo que resulta de asignar value en (row, col).
         
-        used_in_row = {self.matrix[row][c] for c in range(9) if self.matrix[row][c] != 0}
-        used_in_col = {self.matrix[r][col] for r in range(9) if self.matrix[r][col] != 0}
+        Copia el tablero y los candidatos del padre (dos copias planas hechas en C)
+        y sólo actualiza las 20 celdas vecinas de la celda asignada.
+        """
+        node = SudokuNode.__new__(SudokuNode)
+        node.board = self.board.copy()
+        node.depth = self.depth + 1
+        node.propagate = self.propagate
+        node.propagated = 0
         
-        box_row = (row // 3) * 3
-        box_col = (col // 3) * 3
-        used_in_box = set()
+        index = INDEX[row][col]
+        node.board.grid[index] = value
+        bit = BIT[value]
+        if self.units is not None:
+            units = self.units[:]
+            units[row] |= bit
+            units[9 + col] |= bit
+            units[18 + BOX_OF[row][col]] |= bit
+            node.units = units
+        else:
+            node.units = None
+        options = self.options[:]
+        size_count = bytearray(self.size_count)
         
-        for i in range(3):
-            for j in range(3):
-                val = self.matrix[box_row + i][box_col + j]
-                if val != 0:
-                    used_in_box.add(val)
+        size_count[POPCOUNT[options[index]]] -= 1
+        options[index] = 0
+        for peer in PEER_INDICES[index]:
+            mask = options[peer]
+            # Las celdas llenas tienen máscara 0, así que no entran acá
+            if mask & bit:
+                mask ^= bit
+                num_options = POPCOUNT[mask]
+                size_count[num_options + 1] -= 1
+                size_count[num_options] += 1
+                options[peer] = mask
         
-        return all_values - used_in_row - used_in_col - used_in_box
+        node.options = options
+        node.size_count = size_count
+        node._update_bounds()
+        if node.propagate and node.lower_bound != float('inf'):
+            node._propagate()
+        return node
     
     def get_most_constrained_cell(self) -> Optional[Tuple[int, int, Set[int]]]:
         """
-        Extrae la celda vacía con MENOS opciones de la cola de prioridad.
+        Busca la celda vacía con MENOS opciones (a igualdad, la primera por fila y columna).
+        
+        Cada nodo se expande una sola vez, así que recorrer las 81 celdas acá es más
+        barato que mantener un heap por nodo.
         
         Returns:
             Optional[Tuple[int, int, Set[int]]]: (fila, columna, opciones) o None
         """
-        if not self.cells_heap:
-            return None  # No hay celdas vacías
-        
-        # Extraer la celda con MENOS opciones (cabeza de la cola de prioridad)
-        num_options, row, col, _, options = heapq.heappop(self.cells_heap)
+        grid, options = self.board.grid, self.options
+        best, best_size = -1, 10
+        for i in range(81):
+            if grid[i] == 0:
+                size = POPCOUNT[options[i]]
+                if size < best_size:
+                    best, best_size = i, size
+                    if size <= 1:
+                        break
         
-        return (row, col, options)
+        if best < 0:
+            return None  # No hay celdas vacías
+        row, col = CELL_POS[best]
+        return (row, col, set(MASK_VALUES[options[best]]))
+    
+    def memory_size(self) -> int:
+        """Bytes que ocupa el nodo (objeto, tablero y arrays de candidatos y de unidades)."""
+        units = sys.getsizeof(self.units) if self.units is not None else 0
+        return (sys.getsizeof(self) + sys.getsizeof(self.board) + sys.getsizeof(self.board.grid)
+                + sys.getsizeof(self.options) + sys.getsizeof(self.size_count) + units)
     
     def is_solved(self) -> bool:
-        """Verifica si el sudoku está resuelto (no hay celdas en el heap)."""
-        return len(self.cells_heap) == 0
+        """Verifica si el sudoku está resuelto (no quedan celdas vacías)."""
+        return not any(self.size_count)
     
     def __lt__(self, other):
         """Comparador para ordenar los nodos en la cola de prioridad.
@@ -130,29 +218,133 @@ class SudokuNode:
         return self.depth > other.depth
 
 
-def branch_and_bound(matrix: list[list[int]]) -> Optional[list[list[int]]]:
+def branch_and_bound(matrix: Union[list[list[int]], Board, BitBoard], propagate: bool = False,
+                     stats: Optional[SolveStats] = None, max_queue: Optional[int] = None,
+                     budget: Optional[Budget] = None,
+                     value_order: Union[str, ValueOrder, None] = None) -> Optional[list[list[int]]]:
     """
     Resuelve el Sudoku usando Branch and Bound con poda por cotas.
     
+    Por defecto es best-first y la cola de prioridad no tiene tope. Con max_queue la
+    memoria queda acotada: cuando encolar los hijos (hasta 9) superaría max_queue
+    nodos, el nodo extraído ya no los encola a sus hijos sino que su subárbol se recorre en profundidad (DFS,
+    que guarda a lo sumo ~9 nodos por nivel). La búsqueda sigue siendo completa;
+    sólo se pierde el orden best-first dentro de esos subárboles. max_queue=0 es
+    Branch and Bound en profundidad puro.
+    
     Args:
-        matrix: Matriz 9x9 del sudoku con 0 en celdas vacías
+        matrix: Matriz 9x9 del sudoku con 0 en celdas vacías (o un Board / BitBoard)
+        propagate: Aplicar propagación de restricciones en la raíz y en cada nodo
+        stats: Estadísticas de la resolución (incluye peak_queue y peak_memory).
+            Al terminar, los hijos generados también se suman al contador por
+            defecto de utils.counter.
+        max_queue: Tope de nodos en la cola de prioridad (None = sin tope)
+        budget: Tiempo/nodos máximos y token de cancelación; si se excede se
+            lanza BudgetExceeded con las estadísticas parciales
+        value_order: Orden en que se generan los hijos de la celda elegida (ver
+            utils.ordering); decide el desempate en la cola entre hijos con las mismas cotas
     
     Returns:
         Optional[list[list[int]]]: Matriz resuelta o None si no hay solución
     """
+    if stats is None:
+        stats = SolveStats()
+    tried_before = stats.candidates_tried
+    try:
+        return _branch_and_bound(matrix, propagate, stats, max_queue, budget, as_value_order(value_order))
+    finally:
+        add('default', stats.candidates_tried - tried_before)
+
+
+def _expand(node: SudokuNode, stats: SolveStats, limite: float, budget: Optional[Budget] = None,
+            order: Optional[ValueOrder] = None) -> List[SudokuNode]:
+    """Genera los hijos de la celda más restringida que no quedan podados por limite."""
+    children: List[SudokuNode] = []
+    result = node.get_most_constrained_cell()
+    if result is None:
+        return children
+    
+    row, col, available_values = result
+    stats.nodes_expanded += 1
+    if node.depth + 1 > stats.max_depth:
+        stats.max_depth = node.depth + 1
+    
+    if order is None:
+        values = sorted(available_values)
+    else:
+        values = order.node_values(node.board.grid, node.options, INDEX[row][col])
+    for value in values:
+        stats.candidates_tried += 1
+        if budget is not None and stats.candidates_tried >= budget.next_check:
+            budget.check(stats)
+        
+        # El hijo se deriva del padre actualizando sólo los vecinos de (row, col)
+        child_node = node.child(row, col, value)
+        stats.propagation_hits += child_node.propagated
+        
+        # Poda implícita
+        if child_node.lower_bound < limite:
+            children.append(child_node)
+        else:
+            stats.backtracks += 1
+    return children
+
+
+def _walk_depth_first(node: SudokuNode, stats: SolveStats, queued: int, budget: Optional[Budget] = None,
+                      order: Optional[ValueOrder] = None) -> Generator[SudokuNode, None, Optional[SudokuNode]]:
+    """
+    Recorre el subárbol de node en profundidad, entregando cada nodo visitado, y
+    devuelve (valor de retorno del generador) el primer nodo resuelto.
+    
+    Los hijos se apilan ordenados por cota, así que siempre se baja primero por el
+    mejor. queued es el tamaño de la cola de prioridad, para reportar el pico total.
+    """
+    stack = [node]
+    while stack:
+        current_node = stack.pop()
+        yield current_node
+        if current_node.is_solved():
+            return current_node
+        
+        children = _expand(current_node, stats, float('inf'), budget, order)
+        if order is not None:
+            # Con una estrategia, a igualdad de cotas sale primero el valor que ella puso primero
+            # (sin estrategia se mantiene el desempate de siempre, para comparar con corridas anteriores)
+            children.reverse()
+        # Al revés: el mejor hijo queda al final de la pila y sale primero
+        children.sort(reverse=True)
+        stack.extend(children)
+        
+        if queued + len(stack) > stats.peak_queue:
+            stats.peak_queue = queued + len(stack)
+    return None
+
+
+def _walk(matrix: Union[list[list[int]], Board, BitBoard], propagate: bool,
+          stats: SolveStats, max_queue: Optional[int] = None,
+          budget: Optional[Budget] = None, order: Optional[ValueOrder] = None) -> Iterator[SudokuNode]:
+    """
+    La búsqueda de Branch and Bound, entregando cada nodo en el orden en que se visita.
+    
+    Los nodos resueltos sólo se entregan cuando mejoran el límite, así que el último
+    nodo resuelto entregado es la solución. branch_and_bound lo recorre completo y
+    la animación de la GUI lo usa para mostrar la misma búsqueda que se mide.
+    """
     priority_queue = []
     counter = 0
     
-    initial_node = SudokuNode(matrix, depth=0)
+    initial_node = SudokuNode(matrix, depth=0, propagate=propagate)
+    stats.propagation_hits += initial_node.propagated
     
+    # Pistas repetidas o alguna celda sin opciones: no hay solución
     if initial_node.lower_bound == float('inf'):
-        return None
+        return
     
     heapq.heappush(priority_queue, (initial_node.lower_bound, initial_node.upper_bound, counter, initial_node))
     counter += 1
+    stats.peak_queue = max(stats.peak_queue, 1)
     
     limite = float('inf')
-    solution = None
     
     while priority_queue:
         current_lb, current_ub, _, current_node = heapq.heappop(priority_queue) 
@@ -166,28 +358,145 @@ def branch_and_bound(matrix: list[list[int]]) -> Optional[list[list[int]]]:
                 
                 if solution_ub < limite:
                     limite = solution_ub
-                    solution = current_node.matrix
+                    yield current_node
+            
+            elif max_queue is not None and len(priority_queue) + 9 > max_queue:
+                # Los hijos no entran en la cola: resolver este subárbol en profundidad
+                solved_node = yield from _walk_depth_first(current_node, stats, len(priority_queue), budget, order)
+                if solved_node is not None:
+                    limite = solved_node.upper_bound
             
             else:  # NO está resuelto, seguir ramificando
-                # Extrae celda más restringida
-                result = current_node.get_most_constrained_cell()
+                yield current_node
+                for child_node in _expand(current_node, stats, limite, budget, order):
+                    heapq.heappush(priority_queue, 
+                                 (child_node.lower_bound, child_node.upper_bound, counter, child_node))
+                    counter += 1
                 
-                if result is not None:
-                    row, col, available_values = result
-                    
-                    # Generar hijos
-                    for value in sorted(available_values):
-                        increment()
-                        
-                        new_matrix = [r[:] for r in current_node.matrix]
-                        new_matrix[row][col] = value
-                        
-                        child_node = SudokuNode(new_matrix, depth=current_node.depth + 1)
-                        
-                        # Poda implícita
-                        if child_node.lower_bound < limite:
-                            heapq.heappush(priority_queue, 
-                                         (child_node.lower_bound, child_node.upper_bound, counter, child_node))
-                            counter += 1
-
-    return solution
+                if len(priority_queue) > stats.peak_queue:
+                    stats.peak_queue = len(priority_queue)
+
+    # Estimación de la memoria de los nodos en el pico de la cola
+    stats.peak_memory = max(stats.peak_memory, stats.peak_queue * initial_node.memory_size())
+
+
+def _branch_and_bound(matrix: Union[list[list[int]], Board, BitBoard], propagate: bool,
+                      stats: SolveStats, max_queue: Optional[int] = None,
+                      budget: Optional[Budget] = None, order: Optional[ValueOrder] = None) -> Optional[list[list[int]]]:
+    solution = None
+    for node in _walk(matrix, propagate, stats, max_queue, budget, order):
+        if node.is_solved():
+            solution = node
+    return solution.matrix if solution is not None else None
+
+
+def iter_branch_and_bound(matrix: Union[list[list[int]], Board, BitBoard], propagate: bool = False,
+                          stats: Optional[SolveStats] = None) -> Iterator[list[list[int]]]:
+    """
+    Enumera todas las soluciones recorriendo el árbol de Branch and Bound.
+    
+    A diferencia de branch_and_bound no poda por el límite de la mejor solución:
+    sólo descarta los nodos inválidos (cota infinita). Cada solución se vuelca desde
+    el tablero compacto del nodo resuelto a una misma matriz de trabajo, que se
+    entrega sin copiar (sólo es válida hasta pedir la siguiente).
+    
+    Args:
+        matrix: Matriz 9x9 del sudoku con 0 en celdas vacías (o un Board / BitBoard)
+        propagate: Aplicar propagación de restricciones en cada nodo
+        stats: Estadísticas de la enumeración
+    
+    Yields:
+        list[list[int]]: Cada solución, en el orden en que sale de la cola
+    """
+    if stats is None:
+        stats = SolveStats()
+    
+    initial_node = SudokuNode(matrix, depth=0, propagate=propagate)
+    stats.propagation_hits += initial_node.propagated
+    if initial_node.lower_bound == float('inf'):
+        return
+    
+    priority_queue = [(initial_node.lower_bound, initial_node.upper_bound, 0, initial_node)]
+    counter = 1
+    stats.peak_queue = max(stats.peak_queue, 1)
+    # Matriz de trabajo compartida: cada solución se vuelca acá en el lugar (como los
+    # demás enumeradores, sólo es válida hasta pedir la siguiente)
+    solution = [[0] * 9 for _ in range(9)]
+    
+    while priority_queue:
+        _, _, _, current_node = heapq.heappop(priority_queue)
+        
+        if current_node.is_solved():
+            grid = current_node.board.grid
+            for r in range(9):
+                solution[r][:] = grid[r * 9:r * 9 + 9]
+            yield solution
+            continue
+        
+        result = current_node.get_most_constrained_cell()
+        if result is None:
+            continue
+        row, col, available_values = result
+        stats.nodes_expanded += 1
+        if current_node.depth + 1 > stats.max_depth:
+            stats.max_depth = current_node.depth + 1
+        
+        for value in sorted(available_values):
+            stats.candidates_tried += 1
+            child_node = current_node.child(row, col, value)
+            stats.propagation_hits += child_node.propagated
+            if child_node.lower_bound != float('inf'):
+                heapq.heappush(priority_queue,
+                               (child_node.lower_bound, child_node.upper_bound, counter, child_node))
+                counter += 1
+            else:
+                stats.backtracks += 1
+        
+        if len(priority_queue) > stats.peak_queue:
+            stats.peak_queue = len(priority_queue)
+
+
+def iter_branch_and_bound_steps(matrix: Union[list[list[int]], Board, BitBoard], propagate: bool = False,
+                                stats: Optional[SolveStats] = None, max_queue: Optional[int] = None) -> Iterator[Step]:
+    """
+    Genera los pasos de branch_and_bound a medida que se piden, para animar la búsqueda.
+    
+    Recorre exactamente la misma búsqueda que branch_and_bound (mismos nodos, en el
+    mismo orden). Cada nodo visitado se entrega como la diferencia con el tablero
+    del nodo anterior: 'backtrack' en las celdas que se vacían al saltar a otra rama
+    y 'try' en las que completa el nodo (con propagación pueden ser varias). No se
+    guarda la lista de pasos.
+    
+    Args:
+        matrix: Matriz 9x9 del sudoku con 0 en celdas vacías (o un Board / BitBoard)
+        propagate: Aplicar propagación de restricciones en cada nodo
+        stats: Estadísticas de la búsqueda
+        max_queue: Tope de nodos en la cola de prioridad (ver branch_and_bound)
+    
+    Yields:
+        Step: (fila, columna, valor, 'try' | 'backtrack' | 'success')
+    """
+    if stats is None:
+        stats = SolveStats()
+    
+    shown = Board.from_matrix(matrix_of(matrix)).grid
+    clues = bytes(shown)
+    solution = None
+    for node in _walk(matrix, propagate, stats, max_queue):
+        # Llevar el tablero mostrado al del nodo: primero vaciar, después completar
+        grid = node.board.grid
+        changed = [i for i in range(81) if shown[i] != grid[i]]
+        for i in changed:
+            if grid[i] == 0:
+                yield (*CELL_POS[i], 0, 'backtrack')
+        for i in changed:
+            if grid[i] != 0:
+                yield (*CELL_POS[i], grid[i], 'try')
+        shown[:] = grid
+        if node.is_solved():
+            solution = grid
+    
+    if solution is not None:
+        for i in range(81):
+            if not clues[i]:
+                yield (*CELL_POS[i], solution[i], 'success')
@@ -0,0 +1,120 @@
+"""
+Checkpoint de corridas de benchmark, para retomarlas después de un corte.
+
+El archivo es JSONL de sólo agregar: la primera línea guarda la configuración de
+la corrida y los puzzles de cada dificultad (81 caracteres cada uno), y cada línea
+siguiente es un resultado terminado, con flush apenas se escribe. Al reabrirlo se
+cargan los mismos puzzles (no se regeneran) y se cuentan los tests hechos de cada
+(dificultad, implementación); como los resultados de un grupo llegan en orden, lo
+hecho es siempre un prefijo y basta con saltear los primeros done(...) puzzles.
+
+Una línea cortada por el corte (la última, a medio escribir) se descarta.
+"""
+
+import json
+import os
+from typing import Callable, Iterator
+from utils.board import Board
+
+CHECKPOINT_VERSION = 1
+
+
+class Checkpoint:
+    """
+    Attributes:
+        path: Archivo del checkpoint
+        config: Configuración con la que se creó (ver __init__)
+        puzzles: Dificultad -> puzzles de la corrida
+        resumed: True si se abrió un checkpoint existente
+    """
+
+    def __init__(self, path: str, config: dict, make_puzzles: Callable[[], dict[str, list[Board]]]):
+        """
+        Abre el checkpoint o lo crea si no existe.
+
+        Args:
+            path: Archivo del checkpoint
+            config: Parámetros que deben coincidir para retomar (semilla, cantidad, ...); serializable a JSON
+            make_puzzles: Genera los puzzles por dificultad; sólo se llama si el checkpoint es nuevo
+
+        Raises:
+            ValueError: Si el checkpoint existe pero es de otra versión o de otra configuración
+        """
+        self.path = path
+        self.config = config
+        self._done: dict[tuple[str, str], int] = {}
+        self.resumed = os.path.exists(path) and os.path.getsize(path) > 0
+
+        if self.resumed:
+            self._load()
+        else:
+            self.puzzles = make_puzzles()
+            header = {
+                "version": CHECKPOINT_VERSION,
+                "config": config,
+                "puzzles": {d: [p.to_string() for p in ps] for d, ps in self.puzzles.items()},
+            }
+            # Escribir la cabecera completa de una vez: un corte acá no deja un checkpoint a medias
+            tmp = f"{path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(json.dumps(header, ensure_ascii=False) + "\n")
+            os.replace(tmp, path)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != CHECKPOINT_VERSION:
+                raise ValueError(f"Versión de checkpoint no soportada: {header.get('version')!r}")
+            if header["config"] != self.config:
+                raise ValueError(f"El checkpoint {self.path} es de otra configuración ({header['config']}); "
+                                 f"borrarlo o usar otro archivo")
+            self.puzzles = {d: [Board.from_string(p) for p in ps] for d, ps in header["puzzles"].items()}
+
+            valid_end = f.tell()
+            for line in iter(f.readline, b""):
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                key = (row["Dificultad"], row["Implementación"])
+                self._done[key] = self._done.get(key, 0) + 1
+                valid_end = f.tell()
+        # Descartar la línea incompleta del final, si la hay
+        if valid_end < os.path.getsize(self.path):
+            os.truncate(self.path, valid_end)
+
+    def done(self, difficulty: str, implementation: str) -> int:
+        """Cantidad de tests ya terminados de esa dificultad e implementación."""
+        return self._done.get((difficulty, implementation), 0)
+
+    def record(self, row: dict):
+        """Registra un resultado terminado (debe tener 'Dificultad' e 'Implementación')."""
+        self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._file.flush()
+        key = (row["Dificultad"], row["Implementación"])
+        self._done[key] = self._done.get(key, 0) + 1
+
+    def rows(self) -> Iterator[dict]:
+        """Los resultados registrados, de a uno y en orden (sin cargarlos todos)."""
+        with open(self.path, encoding="utf-8") as f:
+            f.readline()
+            for line in f:
+                yield json.loads(line)
+
+    def close(self):
+        self._file.close()
+
+    def remove(self):
+        """Cierra y borra el checkpoint (la corrida terminó)."""
+        self.close()
+        os.remove(self.path)
+
+    def __enter__(self) -> 'Checkpoint':
+        return self
+
+    def __exit__(self, *exc):
+        if not self._file.closed:
+            self.close()
@@ -0,0 +1,122 @@
+"""
+Corpus de puzzles reproducible para los benchmarks.
+
+Formato en disco (versión 1): texto UTF-8 con un puzzle por línea, 81 caracteres
+fila por fila con dígitos 1-9 y '0' o '.' para las celdas vacías. Las líneas que
+empiezan con '#' son comentarios; la primera puede ser la cabecera
+'# sudoku-corpus v1' y las siguientes metadatos '# clave: valor'. Lo que siga al
+puzzle en la misma línea (separado por espacios) se ignora, así que también se
+leen archivos de otras colecciones sin cabecera.
+
+generate_puzzles arma los puzzles con un random.Random sembrado: la misma semilla
+da los mismos puzzles en cualquier corrida y máquina. Cada puzzle sale de una
+solución distinta (la base se transforma con permutaciones que preservan la
+validez). En corpus/ hay además conjuntos difíciles conocidos: 'hard17'
+(puzzles de 17 pistas) y 'hardest' (los "más difíciles" clásicos).
+"""
+
+import os
+import random
+from typing import Iterator, TextIO, Union
+from utils.backtracking import iniciateBaseMatrix
+from utils.board import Board
+from utils.utils import makeDifficulty
+
+CORPUS_VERSION = 1
+HEADER = f"# sudoku-corpus v{CORPUS_VERSION}"
+
+# Conjuntos incluidos en el repo (src/corpus/<nombre>.txt)
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "corpus")
+
+
+def _shuffle(matrix: list[list[int]], rng: random.Random) -> list[list[int]]:
+    """Sudoku equivalente: renombra dígitos, permuta filas/columnas dentro de bandas y bandas, y transpone."""
+    digits = [0] + rng.sample(range(1, 10), 9)
+    rows = [band * 3 + r for band in rng.sample(range(3), 3) for r in rng.sample(range(3), 3)]
+    cols = [stack * 3 + c for stack in rng.sample(range(3), 3) for c in rng.sample(range(3), 3)]
+    shuffled = [[digits[matrix[r][c]] for c in cols] for r in rows]
+    if rng.random() < 0.5:
+        shuffled = [list(col) for col in zip(*shuffled)]
+    return shuffled
+
+
+def generate_puzzles(difficulty: str, count: int, seed: Union[int, str] = 0, unique: bool = True) -> list[Board]:
+    """
+    Genera count puzzles de la dificultad dada, siempre los mismos para la misma semilla.
+
+    Args:
+        difficulty: 'easy', 'medium' o 'hard' (ver makeDifficulty)
+        count: Cantidad de puzzles
+        seed: Semilla; cada dificultad usa su propia secuencia
+        unique: Sólo puzzles con solución única
+    """
+    rng = random.Random(f"{seed}:{difficulty}")
+    puzzles = []
+    for _ in range(count):
+        solution = _shuffle(iniciateBaseMatrix(rng), rng)
+        puzzles.append(Board.from_matrix(makeDifficulty(solution, difficulty, unique, rng)))
+    return puzzles
+
+
+def iter_corpus(source: Union[str, TextIO]) -> Iterator[Board]:
+    """
+    Lee los puzzles de un archivo (ruta o archivo abierto) de a uno, sin cargarlo entero.
+
+    Raises:
+        ValueError: Si la cabecera es de otra versión o una línea no es un puzzle válido
+    """
+    if isinstance(source, str):
+        with open(source, encoding="utf-8") as f:
+            yield from iter_corpus(f)
+        return
+
+    for number, line in enumerate(source, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            if line.startswith("# sudoku-corpus v") and line != HEADER:
+                raise ValueError(f"Versión de corpus no soportada: {line!r}")
+            continue
+        try:
+            yield Board.from_string(line.split()[0])
+        except ValueError as e:
+            raise ValueError(f"Línea {number}: {e}") from None
+
+
+def read_corpus(source: Union[str, TextIO]) -> list[Board]:
+    return list(iter_corpus(source))
+
+
+def read_metadata(path: str) -> dict[str, str]:
+    """Metadatos '# clave: valor' de la cabecera del archivo."""
+    metadata = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.startswith("#"):
+                break
+            key, sep, value = line[1:].partition(":")
+            if sep:
+                metadata[key.strip()] = value.strip()
+    return metadata
+
+
+def write_corpus(path: str, puzzles: list[Board], **metadata):
+    """Guarda los puzzles en el formato v1, con los metadatos en la cabecera."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(HEADER + "\n")
+        for key, value in metadata.items():
+            f.write(f"# {key}: {value}\n")
+        for puzzle in puzzles:
+            f.write(puzzle.to_string(".") + "\n")
+
+
+def bundled_sets() -> list[str]:
+    """Nombres de los conjuntos incluidos en corpus/."""
+    return sorted(name[:-4] for name in os.listdir(CORPUS_DIR) if name.endswith(".txt"))
+
+
+def load_corpus(name_or_path: str) -> list[Board]:
+    """Carga un conjunto incluido por nombre ('hard17', 'hardest') o un archivo por ruta."""
+    bundled = os.path.join(CORPUS_DIR, f"{name_or_path}.txt")
+    return read_corpus(bundled if os.path.exists(bundled) else name_or_path)
@@ -1,17 +1,29 @@
+"""
+Contadores globales por id (compatibilidad).
+
+Los solvers cuentan en un SolveStats propio (utils.stats) y al terminar suman
+sus candidatos probados acá con add(), así que increment/get_count/reset siguen
+funcionando como antes. El lock evita perder incrementos entre hilos.
+"""
+
+import threading
+
 _counters = {}
+_lock = threading.Lock()
 
 def increment(counter_id='default'):
-    global _counters
-    if counter_id not in _counters:
-        _counters[counter_id] = 0
-    _counters[counter_id] += 1
+    add(counter_id, 1)
+
+def add(counter_id='default', amount=1):
+    with _lock:
+        _counters[counter_id] = _counters.get(counter_id, 0) + amount
 
 def get_count(counter_id='default'):
     return _counters.get(counter_id, 0)
 
 def reset(counter_id=None):
-    global _counters
-    if counter_id:
-        _counters[counter_id] = 0
-    else:
-        _counters.clear()
+    with _lock:
+        if counter_id:
+            _counters[counter_id] = 0
+        else:
+            _counters.clear()
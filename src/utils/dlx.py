@@ -0,0 +1,320 @@
+"""
+Dancing Links (Algorithm X de Knuth) para resolver el Sudoku como exact cover.
+
+Cada opción "valor v en la celda (r, c)" es una fila que cubre 4 restricciones:
+- la celda (r, c) tiene un valor
+- la fila r tiene el valor v
+- la columna c tiene el valor v
+- el cuadrante de (r, c) tiene el valor v
+
+Las 324 restricciones son las columnas de la matriz de exact cover. Las listas
+doblemente enlazadas se guardan en arrays paralelos (L, R, U, D, C) para que
+cubrir y descubrir columnas sean sólo asignaciones de enteros.
+"""
+
+from typing import Iterator, Optional, Union
+from utils.bitboard import BitBoard, matrix_of
+from utils.board import Board
+from utils.budget import Budget
+from utils.indices import BOX_OF
+from utils.counter import add
+from utils.stats import SolveStats
+
+NUM_COLUMNS = 324
+
+
+def _constraint_columns(row: int, col: int, value: int) -> tuple[int, int, int, int]:
+    """Columnas (1..324) que cubre colocar value en (row, col). La 0 es la cabecera."""
+    v = value - 1
+    return (
+        1 + row * 9 + col,
+        1 + 81 + row * 9 + v,
+        1 + 162 + col * 9 + v,
+        1 + 243 + BOX_OF[row][col] * 9 + v,
+    )
+
+
+def _build_template() -> tuple[list[int], list[int], list[int], list[int], list[int], list[int]]:
+    """
+    Arma la matriz completa (729 filas x 324 columnas) una sola vez.
+
+    Returns:
+        L, R, U, D, C, S: enlaces de cada nodo, columna de cada nodo y tamaño de cada columna
+    """
+    # Nodo 0: cabecera raíz. Nodos 1..324: cabeceras de columna.
+    size = 1 + NUM_COLUMNS
+    L = [i - 1 for i in range(size)]
+    R = [i + 1 for i in range(size)]
+    L[0] = NUM_COLUMNS
+    R[NUM_COLUMNS] = 0
+    U = list(range(size))
+    D = list(range(size))
+    C = list(range(size))
+    S = [0] * size
+
+    for row in range(9):
+        for col in range(9):
+            for value in range(1, 10):
+                first = len(C)
+                for k, column in enumerate(_constraint_columns(row, col, value)):
+                    node = first + k
+                    # Enlace horizontal circular entre los 4 nodos de la fila
+                    L.append(node - 1 if k > 0 else first + 3)
+                    R.append(node + 1 if k < 3 else first)
+                    # Insertar al final de la columna
+                    U.append(U[column])
+                    D.append(column)
+                    D[U[column]] = node
+                    U[column] = node
+                    C.append(column)
+                    S[column] += 1
+
+    return L, R, U, D, C, S
+
+
+# Se arma la primera vez que se usa (no al importar el módulo, para no demorar el arranque)
+_TEMPLATE: Optional[tuple[list[int], list[int], list[int], list[int], list[int], list[int]]] = None
+
+
+def _template() -> tuple[list[int], list[int], list[int], list[int], list[int], list[int]]:
+    global _TEMPLATE
+    if _TEMPLATE is None:
+        _TEMPLATE = _build_template()
+    return _TEMPLATE
+
+
+def _option_node(row: int, col: int, value: int) -> int:
+    """Primer nodo de la fila de exact cover que corresponde a value en (row, col)."""
+    return 1 + NUM_COLUMNS + ((row * 9 + col) * 9 + value - 1) * 4
+
+
+def _option_of(node: int) -> tuple[int, int, int]:
+    """Inversa de _option_node: (fila, columna, valor) de cualquier nodo de la opción."""
+    cell, v = divmod((node - 1 - NUM_COLUMNS) // 4, 9)
+    row, col = divmod(cell, 9)
+    return row, col, v + 1
+
+
+class DancingLinks:
+    """
+    Estado de una resolución con Algorithm X.
+
+    Attributes:
+        L, R, U, D: Enlaces izquierda/derecha/arriba/abajo de cada nodo
+        C: Cabecera de columna de cada nodo
+        S: Cantidad de nodos activos en cada columna
+        solution: Nodos de las opciones elegidas durante la búsqueda
+        stats: Estadísticas de la resolución
+        budget: Límites de la resolución (None = sin límites)
+    """
+
+    def __init__(self, stats: Optional[SolveStats] = None, budget: Optional[Budget] = None):
+        self.L, self.R, self.U, self.D, self.C, self.S = (links[:] for links in _template())
+        self.solution: list[int] = []
+        self.stats = stats if stats is not None else SolveStats()
+        self.budget = budget
+
+    def cover(self, column: int):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        L[R[column]] = L[column]
+        R[L[column]] = R[column]
+        i = D[column]
+        while i != column:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, column: int):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[column]
+        while i != column:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        L[R[column]] = column
+        R[L[column]] = column
+
+    def select(self, node: int) -> bool:
+        """
+        Fija una opción (por ejemplo una pista) cubriendo sus 4 columnas.
+
+        Returns:
+            bool: False si alguna columna ya estaba cubierta (pistas contradictorias)
+        """
+        R, L, C = self.R, self.L, self.C
+        j = node
+        while True:
+            column = C[j]
+            # Una columna cubierta quedó fuera de la lista de cabeceras
+            if R[L[column]] != column:
+                return False
+            self.cover(column)
+            j = R[j]
+            if j == node:
+                return True
+
+    def search(self, depth: int = 0) -> bool:
+        R, L, D, C, S = self.R, self.L, self.D, self.C, self.S
+        stats = self.stats
+
+        # Caso base: todas las restricciones cubiertas
+        if R[0] == 0:
+            return True
+
+        # Heurística S de Knuth: columna con menos opciones (equivale a MCV)
+        column = R[0]
+        best, best_size = column, S[column]
+        while column != 0 and best_size > 1:
+            if S[column] < best_size:
+                best, best_size = column, S[column]
+            column = R[column]
+        if best_size == 0:
+            return False
+
+        stats.nodes_expanded += 1
+        if depth + 1 > stats.max_depth:
+            stats.max_depth = depth + 1
+
+        self.cover(best)
+        r = D[best]
+        while r != best:
+            stats.candidates_tried += 1
+            if self.budget is not None and stats.candidates_tried >= self.budget.next_check:
+                self.budget.check(stats)
+            self.solution.append(r)
+            j = R[r]
+            while j != r:
+                self.cover(C[j])
+                j = R[j]
+
+            if self.search(depth + 1):
+                return True
+
+            # Retroceder: descubrir en orden inverso
+            stats.backtracks += 1
+            self.solution.pop()
+            j = L[r]
+            while j != r:
+                self.uncover(C[j])
+                j = L[j]
+            r = D[r]
+        self.uncover(best)
+        return False
+
+    def iter_search(self, cells: list[list[int]], depth: int = 0) -> Iterator[list[list[int]]]:
+        """
+        Versión generadora de search: entrega cada exact cover encontrado.
+
+        cells se mantiene sincronizada con las opciones elegidas (se escribe al
+        elegir y se borra al retroceder), así que cada solución se entrega sin
+        copiar el tablero. Sólo es válida hasta pedir la siguiente.
+        """
+        R, L, D, C, S = self.R, self.L, self.D, self.C, self.S
+        stats = self.stats
+
+        if R[0] == 0:
+            yield cells
+            return
+
+        column = R[0]
+        best, best_size = column, S[column]
+        while column != 0 and best_size > 1:
+            if S[column] < best_size:
+                best, best_size = column, S[column]
+            column = R[column]
+        if best_size == 0:
+            return
+
+        stats.nodes_expanded += 1
+        if depth + 1 > stats.max_depth:
+            stats.max_depth = depth + 1
+
+        self.cover(best)
+        r = D[best]
+        while r != best:
+            stats.candidates_tried += 1
+            row, col, value = _option_of(r)
+            cells[row][col] = value
+            j = R[r]
+            while j != r:
+                self.cover(C[j])
+                j = R[j]
+
+            yield from self.iter_search(cells, depth + 1)
+
+            stats.backtracks += 1
+            cells[row][col] = 0
+            j = L[r]
+            while j != r:
+                self.uncover(C[j])
+                j = L[j]
+            r = D[r]
+        self.uncover(best)
+
+
+def dancing_links(matrix: Union[list[list[int]], Board, BitBoard],
+                  stats: Optional[SolveStats] = None, budget: Optional[Budget] = None) -> Optional[list[list[int]]]:
+    """
+    Resuelve el Sudoku con Dancing Links (Algorithm X).
+
+    Args:
+        matrix: Matriz 9x9 del sudoku con 0 en celdas vacías (o un Board / BitBoard)
+        stats: Estadísticas de la resolución. Al terminar, las opciones probadas
+            también se suman al contador 'dlx' de utils.counter.
+        budget: Tiempo/nodos máximos y token de cancelación; si se excede se
+            lanza BudgetExceeded con las estadísticas parciales
+
+    Returns:
+        Optional[list[list[int]]]: Matriz resuelta o None si no hay solución
+    """
+    cells = matrix_of(matrix)
+    dlx = DancingLinks(stats, budget)
+
+    # Las pistas se eligen de entrada: sus columnas quedan cubiertas
+    for row in range(9):
+        for col in range(9):
+            value = cells[row][col]
+            if value != 0 and not dlx.select(_option_node(row, col, value)):
+                return None
+
+    tried_before = dlx.stats.candidates_tried
+    try:
+        found = dlx.search()
+    finally:
+        add('dlx', dlx.stats.candidates_tried - tried_before)
+    if not found:
+        return None
+
+    solution = [r[:] for r in cells]
+    for node in dlx.solution:
+        row, col, value = _option_of(node)
+        solution[row][col] = value
+    return solution
+
+
+def iter_dancing_links(matrix: Union[list[list[int]], Board, BitBoard],
+                       stats: Optional[SolveStats] = None) -> Iterator[list[list[int]]]:
+    """
+    Enumera todas las soluciones con Dancing Links.
+
+    Yields:
+        list[list[int]]: Tablero de trabajo con cada solución (no es una copia)
+    """
+    cells = [r[:] for r in matrix_of(matrix)]
+    dlx = DancingLinks(stats)
+
+    for row in range(9):
+        for col in range(9):
+            value = cells[row][col]
+            if value != 0 and not dlx.select(_option_node(row, col, value)):
+                return
+
+    yield from dlx.iter_search(cells)
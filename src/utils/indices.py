@@ -0,0 +1,47 @@
+"""
+Tablas de índices precalculadas una sola vez al importar.
+
+Todo el código que necesita saber qué celdas comparten fila, columna o cuadrante
+las toma de acá en vez de recalcular (row // 3) * 3 y recorrer 9/9/9 celdas.
+
+Convenciones:
+- Celda (r, c) <-> índice plano r * 9 + c (0..80)
+- Cuadrantes de 0 (superior izquierdo) a 8 (inferior derecho)
+- Unidades: filas 0-8, columnas 9-17 y cuadrantes 18-26
+"""
+
+Cell = tuple[int, int]
+
+# Índice plano <-> (fila, columna) <-> cuadrante
+INDEX: list[list[int]] = [[r * 9 + c for c in range(9)] for r in range(9)]
+CELL_POS: tuple[Cell, ...] = tuple((i // 9, i % 9) for i in range(81))
+CELL_ROW: tuple[int, ...] = tuple(i // 9 for i in range(81))
+CELL_COL: tuple[int, ...] = tuple(i % 9 for i in range(81))
+CELL_BOX: tuple[int, ...] = tuple((i // 27) * 3 + (i % 9) // 3 for i in range(81))
+BOX_OF: list[list[int]] = [[CELL_BOX[r * 9 + c] for c in range(9)] for r in range(9)]
+
+# Celdas de cada cuadrante y de cada una de las 27 unidades
+BOX_CELLS: tuple[tuple[Cell, ...], ...] = tuple(
+    tuple((r, c) for r in range(9) for c in range(9) if BOX_OF[r][c] == b) for b in range(9)
+)
+UNITS: tuple[tuple[Cell, ...], ...] = (
+    tuple(tuple((r, c) for c in range(9)) for r in range(9))
+    + tuple(tuple((r, c) for r in range(9)) for c in range(9))
+    + BOX_CELLS
+)
+UNIT_INDICES: tuple[tuple[int, ...], ...] = tuple(tuple(INDEX[r][c] for r, c in unit) for unit in UNITS)
+
+# Las 20 celdas que comparten fila, columna o cuadrante con cada celda
+PEERS: list[list[tuple[Cell, ...]]] = [
+    [
+        tuple(
+            (r, c) for r in range(9) for c in range(9)
+            if (r, c) != (row, col) and (r == row or c == col or BOX_OF[r][c] == BOX_OF[row][col])
+        )
+        for col in range(9)
+    ]
+    for row in range(9)
+]
+PEER_INDICES: tuple[tuple[int, ...], ...] = tuple(
+    tuple(INDEX[r][c] for r, c in PEERS[row][col]) for row, col in CELL_POS
+)
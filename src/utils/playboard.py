@@ -0,0 +1,105 @@
+"""
+Tablero del modo "Jugar" con detección de conflictos incremental.
+
+Además de los valores, guarda cuántas veces aparece cada valor en cada fila,
+columna y cuadrante. Cada edición sólo actualiza los 3 contadores de la celda,
+así que validar una entrada y saber si el sudoku quedó completo es O(1), sin
+recorrer el tablero ni leer los widgets de la GUI.
+"""
+
+from utils.board import Board
+from utils.indices import CELL_BOX, CELL_COL, CELL_POS, CELL_ROW, INDEX, PEER_INDICES
+
+
+class PlayBoard:
+    """
+    Attributes:
+        board: Valores actuales (pistas y entradas del jugador)
+        fixed: 1 en las celdas que son pistas (no se pueden editar)
+        row_counts, col_counts, box_counts: Apariciones de cada valor por unidad,
+            en la posición unidad * 10 + valor
+        filled: Cantidad de celdas con valor
+        duplicates: Repeticiones sobrantes sumadas en todas las unidades (0 = sin conflictos)
+    """
+
+    __slots__ = ('board', 'fixed', 'row_counts', 'col_counts', 'box_counts', 'filled', 'duplicates')
+
+    def __init__(self, puzzle: list[list[int]]):
+        self.board = Board()
+        self.fixed = bytes(1 if v else 0 for row in puzzle for v in row)
+        self.row_counts = bytearray(90)
+        self.col_counts = bytearray(90)
+        self.box_counts = bytearray(90)
+        self.filled = 0
+        self.duplicates = 0
+        for r in range(9):
+            for c in range(9):
+                if puzzle[r][c]:
+                    self._add(INDEX[r][c], puzzle[r][c])
+
+    def _add(self, i: int, value: int):
+        self.board.grid[i] = value
+        self.filled += 1
+        for counts, unit in ((self.row_counts, CELL_ROW[i]), (self.col_counts, CELL_COL[i]),
+                             (self.box_counts, CELL_BOX[i])):
+            k = unit * 10 + value
+            if counts[k]:
+                self.duplicates += 1
+            counts[k] += 1
+
+    def _remove(self, i: int):
+        value = self.board.grid[i]
+        self.board.grid[i] = 0
+        self.filled -= 1
+        for counts, unit in ((self.row_counts, CELL_ROW[i]), (self.col_counts, CELL_COL[i]),
+                             (self.box_counts, CELL_BOX[i])):
+            k = unit * 10 + value
+            counts[k] -= 1
+            if counts[k]:
+                self.duplicates -= 1
+
+    def set(self, row: int, col: int, value: int) -> bool:
+        """
+        Escribe value en la celda (0 la vacía) y actualiza los contadores.
+
+        Returns:
+            bool: True si la celda quedó sin conflictos con sus vecinos
+        """
+        i = INDEX[row][col]
+        if self.fixed[i]:
+            raise ValueError(f"La celda ({row}, {col}) es una pista")
+        if self.board.grid[i] != value:
+            if self.board.grid[i]:
+                self._remove(i)
+            if value:
+                self._add(i, value)
+        return self.is_valid(row, col)
+
+    def clear(self, row: int, col: int):
+        self.set(row, col, 0)
+
+    def get(self, row: int, col: int) -> int:
+        return self.board.grid[INDEX[row][col]]
+
+    def is_valid(self, row: int, col: int) -> bool:
+        """True si la celda está vacía o su valor no se repite en su fila, columna ni cuadrante."""
+        i = INDEX[row][col]
+        value = self.board.grid[i]
+        if not value:
+            return True
+        return (self.row_counts[CELL_ROW[i] * 10 + value] == 1
+                and self.col_counts[CELL_COL[i] * 10 + value] == 1
+                and self.box_counts[CELL_BOX[i] * 10 + value] == 1)
+
+    def conflicts(self, row: int, col: int) -> list[tuple[int, int]]:
+        """Vecinos (fila, columna) que tienen el mismo valor que la celda, para resaltarlos."""
+        i = INDEX[row][col]
+        value = self.board.grid[i]
+        if not value or self.is_valid(row, col):
+            return []
+        grid = self.board.grid
+        return [CELL_POS[j] for j in PEER_INDICES[i] if grid[j] == value]
+
+    def is_complete(self) -> bool:
+        """True si están las 81 celdas y no hay ningún conflicto (sudoku resuelto)."""
+        return self.filled == 81 and self.duplicates == 0
@@ -0,0 +1,157 @@
+"""
+Propagación de restricciones antes de ramificar.
+
+Aplica hasta llegar a un punto fijo:
+- Naked singles: una celda vacía con un único candidato
+- Hidden singles: un valor que sólo entra en una celda de su fila/columna/cuadrante
+- Locked candidates: si en un cuadrante un valor sólo entra en una fila (o columna),
+  se elimina del resto de esa fila (pointing); y al revés, si en una fila/columna
+  sólo entra dentro de un cuadrante, se elimina del resto del cuadrante (claiming)
+
+Los valores deducidos se colocan en el BitBoard y se anotan en `trail` para que el
+solver pueda deshacerlos al retroceder.
+"""
+
+from typing import Dict, Optional, Tuple
+from utils.bitboard import BIT, FULL_MASK, MASK_VALUES, POPCOUNT, BitBoard
+from utils.indices import BOX_OF, PEERS, UNITS
+
+Cell = Tuple[int, int]
+
+
+class _Contradiction(Exception):
+    """Alguna celda o unidad se quedó sin opciones."""
+
+
+def propagate_constraints(
+    bits: BitBoard,
+    trail: Optional[list[Cell]] = None,
+    candidates: Optional[Dict[Cell, int]] = None,
+) -> bool:
+    """
+    Propaga naked singles, hidden singles y locked candidates hasta el punto fijo.
+
+    Args:
+        bits: Tablero a completar (se modifica en el lugar)
+        trail: Lista donde se agregan las celdas colocadas, para poder deshacerlas
+        candidates: Máscaras de candidatos de las celdas vacías. Si se pasan, se
+            actualizan en el lugar (incluidas las eliminaciones por locked candidates);
+            si no, se calculan a partir de las máscaras del tablero.
+
+    Returns:
+        bool: False si se llegó a una contradicción (el tablero no tiene solución)
+    """
+    if trail is None:
+        trail = []
+    if candidates is None:
+        candidates = {
+            (r, c): bits.candidates_mask(r, c)
+            for r in range(9) for c in range(9) if bits.cells[r][c] == 0
+        }
+
+    try:
+        while True:
+            if _naked_singles(bits, candidates, trail):
+                continue
+            if _hidden_singles(bits, candidates, trail):
+                continue
+            if _locked_candidates(bits, candidates):
+                continue
+            return True
+    except _Contradiction:
+        return False
+
+
+def _assign(bits: BitBoard, candidates: Dict[Cell, int], trail: list[Cell], cell: Cell, value: int):
+    row, col = cell
+    bits.place(value, row, col)
+    trail.append(cell)
+    del candidates[cell]
+
+    clear = ~BIT[value]
+    for peer in PEERS[row][col]:
+        mask = candidates.get(peer)
+        if mask is not None:
+            mask &= clear
+            if mask == 0:
+                raise _Contradiction
+            candidates[peer] = mask
+
+
+def _naked_singles(bits: BitBoard, candidates: Dict[Cell, int], trail: list[Cell]) -> bool:
+    found = False
+    for cell, mask in list(candidates.items()):
+        # La celda pudo haberse llenado en esta misma pasada
+        mask = candidates.get(cell)
+        if mask is None:
+            continue
+        if mask == 0:
+            raise _Contradiction
+        if POPCOUNT[mask] == 1:
+            _assign(bits, candidates, trail, cell, MASK_VALUES[mask][0])
+            found = True
+    return found
+
+
+def _hidden_singles(bits: BitBoard, candidates: Dict[Cell, int], trail: list[Cell]) -> bool:
+    found = False
+    for unit, cells in enumerate(UNITS):
+        placed = bits.unit_mask(unit)
+        for value in MASK_VALUES[~placed & FULL_MASK]:
+            bit = BIT[value]
+            where = None
+            count = 0
+            for cell in cells:
+                mask = candidates.get(cell)
+                if mask is not None and mask & bit:
+                    where = cell
+                    count += 1
+                    if count > 1:
+                        break
+            if count == 0:
+                # El valor no entra en ninguna celda de la unidad
+                raise _Contradiction
+            if count == 1:
+                _assign(bits, candidates, trail, where, value)
+                found = True
+    return found
+
+
+def _eliminate(candidates: Dict[Cell, int], cells, bit: int, keep) -> bool:
+    """Quita bit de las celdas fuera de keep. Devuelve True si eliminó algo."""
+    changed = False
+    for cell in cells:
+        if cell in keep:
+            continue
+        mask = candidates.get(cell)
+        if mask is not None and mask & bit:
+            mask ^= bit
+            if mask == 0:
+                raise _Contradiction
+            candidates[cell] = mask
+            changed = True
+    return changed
+
+
+def _locked_candidates(bits: BitBoard, candidates: Dict[Cell, int]) -> bool:
+    changed = False
+    for unit, cells in enumerate(UNITS):
+        placed = bits.unit_mask(unit)
+        for value in MASK_VALUES[~placed & FULL_MASK]:
+            bit = BIT[value]
+            where = [cell for cell in cells if candidates.get(cell, 0) & bit]
+            if len(where) < 2:
+                continue
+            rows = {r for r, _ in where}
+            cols = {c for _, c in where}
+            boxes = {BOX_OF[r][c] for r, c in where}
+            if unit >= 18:
+                # Pointing: dentro del cuadrante el valor está confinado a una fila o columna
+                if len(rows) == 1:
+                    changed |= _eliminate(candidates, UNITS[rows.pop()], bit, cells)
+                if len(cols) == 1:
+                    changed |= _eliminate(candidates, UNITS[9 + cols.pop()], bit, cells)
+            elif len(boxes) == 1:
+                # Claiming: dentro de la fila/columna el valor está confinado a un cuadrante
+                changed |= _eliminate(candidates, UNITS[18 + boxes.pop()], bit, cells)
+    return changed
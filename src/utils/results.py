@@ -0,0 +1,164 @@
+"""
+Escritura de resultados a medida que se producen.
+
+Cada fila (un dict) se escribe apenas termina su resolución, así que la memoria
+no crece con el tamaño de la corrida y un corte no pierde lo ya medido:
+- CSV y JSONL: una línea por fila, con flush en cada una
+- Parquet: las filas se juntan en row groups de batch_size (requiere pyarrow)
+- Excel: no es un formato de streaming; to_excel convierte al final un CSV/JSONL
+  ya escrito (requiere pandas y openpyxl)
+
+Los promedios por grupo se calculan en línea con RunningStats.
+"""
+
+import csv
+import json
+import math
+import os
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ResultWriter(ABC):
+    """Interfaz de los writers: write(fila), close() y uso como context manager."""
+
+    @abstractmethod
+    def write(self, row: dict):
+        """Escribe una fila (columna -> valor)."""
+
+    def close(self):
+        pass
+
+    def __enter__(self) -> 'ResultWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvWriter(ResultWriter):
+    """Las columnas salen de la primera fila."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer: Optional[csv.DictWriter] = None
+
+    def write(self, row: dict):
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(row))
+            self._writer.writeheader()
+        self._writer.writerow(row)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class JsonlWriter(ResultWriter):
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, row: dict):
+        self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter(ResultWriter):
+    """Escribe un row group cada batch_size filas (las pendientes se escriben al cerrar)."""
+
+    def __init__(self, path: str, batch_size: int = 1000):
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as e:
+            raise ImportError("La salida Parquet necesita pyarrow (pip install pyarrow)") from e
+        self.path = path
+        self.batch_size = batch_size
+        self._rows: list[dict] = []
+        self._writer = None
+
+    def write(self, row: dict):
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not self._rows:
+            return
+        table = pa.Table.from_pylist(self._rows)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+        self._rows = []
+
+    def close(self):
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+
+
+WRITERS = {
+    ".csv": CsvWriter,
+    ".jsonl": JsonlWriter,
+    ".parquet": ParquetWriter,
+}
+
+
+def open_writer(path: str) -> ResultWriter:
+    """Elige el writer por la extensión del archivo (.csv, .jsonl o .parquet)."""
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        return WRITERS[ext](path)
+    except KeyError:
+        raise ValueError(f"Formato de resultados desconocido: {ext!r}. Opciones: {', '.join(WRITERS)}") from None
+
+
+def to_excel(path: str, xlsx_path: str, summary_rows: Optional[list[dict]] = None):
+    """
+    Conversión final a Excel de un CSV o JSONL, con los promedios en otra hoja.
+    Necesita pandas y openpyxl, que se importan recién acá.
+    """
+    import pandas as pd
+
+    if path.lower().endswith(".jsonl"):
+        detail = pd.read_json(path, lines=True)
+    else:
+        detail = pd.read_csv(path)
+    with pd.ExcelWriter(xlsx_path, engine='openpyxl') as writer:
+        detail.to_excel(writer, sheet_name='Resultados Detallados', index=False)
+        if summary_rows:
+            pd.DataFrame(summary_rows).to_excel(writer, sheet_name='Promedios', index=False)
+
+
+class RunningStats:
+    """
+    Cantidad, total, media y desvío de una serie de valores, en memoria constante
+    (algoritmo de Welford).
+    """
+
+    __slots__ = ('count', 'total', 'mean', '_m2')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
@@ -0,0 +1,166 @@
+"""
+Conteo y enumeración de soluciones.
+
+Sirve para chequear unicidad: count_solutions(puzzle, limit=2) corta apenas
+encuentra una segunda solución, así que no recorre todo el árbol.
+
+iter_solutions entrega las soluciones a medida que se encuentran. Por defecto usa
+una búsqueda MCV sobre máscaras de bits ('mcv'), pero también puede recorrer el
+árbol de cualquiera de los solvers ('backtracking', 'branch_and_bound',
+'dancing_links'). Las soluciones NO se copian: cada una es el tablero de trabajo
+del solver y sólo es válida hasta pedir la siguiente (copiarla si se necesita).
+"""
+
+from itertools import islice
+from typing import Iterator, Optional, Union
+from utils.backtracking import iter_backtracking
+from utils.bitboard import BIT, MASK_VALUES, POPCOUNT, BitBoard, matrix_of
+from utils.board import Board
+from utils.byb import iter_branch_and_bound
+from utils.dlx import iter_dancing_links
+from utils.stats import SolveStats
+
+ENUMERATORS = {
+    "backtracking": iter_backtracking,
+    "branch_and_bound": iter_branch_and_bound,
+    "dancing_links": iter_dancing_links,
+}
+
+
+def iter_solutions(puzzle: Union[list[list[int]], Board, BitBoard], algorithm: str = "mcv",
+                   stats: Optional[SolveStats] = None) -> Iterator[list[list[int]]]:
+    """
+    Genera las soluciones del puzzle de forma perezosa.
+
+    Args:
+        puzzle: Matriz 9x9 con 0 en celdas vacías (no se modifica)
+        algorithm: 'mcv' o el nombre de un solver de utils.solvers
+        stats: Estadísticas de la búsqueda
+
+    Yields:
+        list[list[int]]: Cada solución (tablero de trabajo, no una copia)
+    """
+    if algorithm != "mcv":
+        try:
+            enumerator = ENUMERATORS[algorithm]
+        except KeyError:
+            raise ValueError(f"Algoritmo desconocido: {algorithm!r}. Opciones: mcv, {', '.join(ENUMERATORS)}") from None
+        yield from enumerator(puzzle, stats=stats)
+        return
+
+    bits = BitBoard(matrix_of(puzzle))
+    if not bits.consistent:
+        return
+    yield from _iter_mcv(bits, bits.empty_cells(), stats if stats is not None else SolveStats(), 0)
+
+
+def count_solutions(puzzle: Union[list[list[int]], Board, BitBoard], limit: int = 2, algorithm: str = "mcv") -> int:
+    """
+    Cuenta las soluciones del puzzle, deteniéndose al llegar a limit.
+
+    Args:
+        puzzle: Matriz 9x9 con 0 en celdas vacías (no se modifica)
+        limit: Máximo de soluciones a contar
+        algorithm: 'mcv' (el más rápido) o el nombre de un solver
+
+    Returns:
+        int: Cantidad de soluciones encontradas (como mucho limit)
+    """
+    if algorithm != "mcv":
+        return sum(1 for _ in islice(iter_solutions(puzzle, algorithm), limit))
+
+    bits = BitBoard(matrix_of(puzzle))
+    if not bits.consistent:
+        return 0
+    return _count(bits, bits.empty_cells(), limit)
+
+
+def is_unique(puzzle: Union[list[list[int]], Board, BitBoard]) -> bool:
+    """True si el puzzle tiene exactamente una solución."""
+    return count_solutions(puzzle, limit=2) == 1
+
+
+def has_other_solution(puzzle: list[list[int]], row: int, col: int, value: int) -> bool:
+    """
+    Dado un puzzle con solución única en la que (row, col) vale value, indica si al
+    vaciar esa celda aparece otra solución. Alcanza con buscar UNA solución con otro
+    valor en la celda, que es mucho más barato que contar hasta 2.
+
+    Args:
+        puzzle: Matriz con la celda (row, col) ya vaciada (no se modifica)
+    """
+    bits = BitBoard(puzzle)
+    empties = [cell for cell in bits.empty_cells() if cell != (row, col)]
+    for other in MASK_VALUES[bits.candidates_mask(row, col) & ~BIT[value]]:
+        bits.place(other, row, col)
+        if _count(bits, empties, 1):
+            return True
+        bits.remove(row, col)
+    return False
+
+
+def _select_mcv(bits: BitBoard, empties: list[tuple[int, int]]) -> tuple[int, int, int]:
+    """Índice, máscara y cantidad de candidatos de la celda vacía con menos opciones."""
+    best_index, best_mask, best_size = 0, 0, 10
+    for i, (r, c) in enumerate(empties):
+        mask = bits.candidates_mask(r, c)
+        size = POPCOUNT[mask]
+        if size < best_size:
+            best_index, best_mask, best_size = i, mask, size
+            if size <= 1:
+                break
+    return best_index, best_mask, best_size
+
+
+def _iter_mcv(bits: BitBoard, empties: list[tuple[int, int]], stats: SolveStats, depth: int) -> Iterator[list[list[int]]]:
+    if not empties:
+        yield bits.cells
+        return
+
+    best_index, best_mask, best_size = _select_mcv(bits, empties)
+    if best_size == 0:
+        return
+
+    stats.nodes_expanded += 1
+    if depth + 1 > stats.max_depth:
+        stats.max_depth = depth + 1
+
+    empties[best_index], empties[-1] = empties[-1], empties[best_index]
+    row, col = empties.pop()
+
+    for value in MASK_VALUES[best_mask]:
+        bits.place(value, row, col)
+        stats.candidates_tried += 1
+        yield from _iter_mcv(bits, empties, stats, depth + 1)
+        bits.remove(row, col)
+        stats.backtracks += 1
+
+    empties.append((row, col))
+    empties[best_index], empties[-1] = empties[-1], empties[best_index]
+
+
+def _count(bits: BitBoard, empties: list[tuple[int, int]], limit: int) -> int:
+    if not empties:
+        return 1
+
+    # MCV: la celda vacía con menos candidatos
+    best_index, best_mask, best_size = _select_mcv(bits, empties)
+    if best_size == 0:
+        return 0
+
+    # Sacar la celda de la lista intercambiándola con la última (O(1))
+    empties[best_index], empties[-1] = empties[-1], empties[best_index]
+    row, col = empties.pop()
+
+    total = 0
+    for value in MASK_VALUES[best_mask]:
+        bits.place(value, row, col)
+        total += _count(bits, empties, limit - total)
+        bits.remove(row, col)
+        if total >= limit:
+            break
+
+    # Dejar la lista como estaba para el llamador
+    empties.append((row, col))
+    empties[best_index], empties[-1] = empties[-1], empties[best_index]
+    return total
@@ -0,0 +1,41 @@
+"""
+Registro de los solvers disponibles.
+
+Cada entrada es nombre -> (id del contador en utils.counter, función). Lo usan el
+benchmark y la API de resolución en lote para elegir el algoritmo por nombre.
+"""
+
+from typing import Callable, Optional
+from utils.backtracking import backtracking, backtracking_iterative
+from utils.byb import branch_and_bound
+from utils.dlx import dancing_links
+
+Solver = Callable[..., Optional[list[list[int]]]]
+
+SOLVERS: dict[str, tuple[str, Solver]] = {
+    "backtracking": ("backtracking", backtracking),
+    "backtracking_iterative": ("backtracking", backtracking_iterative),
+    "branch_and_bound": ("default", branch_and_bound),
+    "dancing_links": ("dlx", dancing_links),
+}
+
+# Capacidades: solvers que aceptan propagate=True y value_order (ver utils.ordering)
+PROPAGATING_SOLVERS = ("backtracking", "branch_and_bound")
+VALUE_ORDER_SOLVERS = ("backtracking", "branch_and_bound")
+
+
+def get_solver(name: str) -> tuple[str, Solver]:
+    """Devuelve (id del contador, función) del solver; ValueError si no existe."""
+    try:
+        return SOLVERS[name]
+    except KeyError:
+        raise ValueError(f"Solver desconocido: {name!r}. Opciones: {', '.join(SOLVERS)}") from None
+
+
+def check_options(name: str, options: dict):
+    """ValueError si el solver no existe o no acepta propagate / value_order."""
+    get_solver(name)
+    if options.get("propagate") and name not in PROPAGATING_SOLVERS:
+        raise ValueError(f"propagate sólo se puede usar con {', '.join(PROPAGATING_SOLVERS)} (no con {name!r})")
+    if options.get("value_order", "natural") != "natural" and name not in VALUE_ORDER_SOLVERS:
+        raise ValueError(f"value_order sólo se puede usar con {', '.join(VALUE_ORDER_SOLVERS)} (no con {name!r})")
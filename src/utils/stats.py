@@ -0,0 +1,40 @@
+"""
+Estadísticas de una resolución.
+
+Cada llamada a un solver usa su propio SolveStats, así que varias resoluciones
+concurrentes (hilos o procesos) no se pisan entre sí como pasaba con el dict global
+de utils.counter. Los campos se incrementan como atributos (con __slots__), sin
+buscar ninguna clave en un dict dentro del loop principal.
+"""
+
+
+class SolveStats:
+    """
+    Attributes:
+        nodes_expanded: Nodos del árbol de búsqueda en los que se ramificó
+        candidates_tried: Valores probados (lo que cuentan los contadores de utils.counter)
+        backtracks: Valores que se deshicieron al retroceder
+        max_depth: Profundidad máxima alcanzada en el árbol
+        propagation_hits: Celdas completadas por la propagación de restricciones
+        peak_queue: Tamaño máximo de la cola de prioridad (sólo Branch and Bound)
+        peak_memory: Bytes estimados de los nodos encolados en el pico (sólo Branch and Bound)
+    """
+
+    __slots__ = ('nodes_expanded', 'candidates_tried', 'backtracks', 'max_depth', 'propagation_hits', 'peak_queue',
+                 'peak_memory')
+
+    def __init__(self):
+        self.nodes_expanded = 0
+        self.candidates_tried = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.propagation_hits = 0
+        self.peak_queue = 0
+        self.peak_memory = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value}" for name, value in self.as_dict().items())
+        return f"SolveStats({fields})"
@@ -3,8 +3,9 @@ Archivo de utilidades para el solver de Sudoku
 Aca deberia estar toda la logica de las funciones que se van a usar en la implementacion
 """
 
-from random import randint, sample
-from typing import Literal
+import random
+from typing import Literal, Optional
+from utils.indices import BOX_CELLS, BOX_OF
 
 # print fachero de la matriz
 def print_matrix(matrix: list[list[int]]):
@@ -39,13 +40,15 @@ def print_matrix(matrix: list[list[int]]):
     print("┗━━━┷━━━┷━━━┻━━━┷━━━┷━━━┻━━━┷━━━┷━━━┛")
 
 # retorna una matriz con diagonal aleatoria para generar un sudoku completo
-def populate_matrix(matrix: list[list[int]]):
+# rng permite pasar un random.Random con semilla para que el resultado sea reproducible
+def populate_matrix(matrix: list[list[int]], rng: Optional[random.Random] = None):
+    rng = rng or random
     list = [[],[],[]]
     for i in range(3):
         for j in range(3):
-            num = randint(1, 9)
+            num = rng.randint(1, 9)
             while num in list[i]:
-                num = randint(1, 9)
+                num = rng.randint(1, 9)
             list[i].append(num)
     
     fil_col = 0
@@ -56,7 +59,8 @@ def populate_matrix(matrix: list[list[int]]):
 
     return matrix
 
-def chooseCells(matrix: list[list[int]], cells: int):
+def chooseCells(matrix: list[list[int]], cells: int, unique: bool = False, rng: Optional[random.Random] = None):
+    rng = rng or random
     # Crear lista de todas las posiciones con números
     filled_cells = []
     for i in range(9):
@@ -64,9 +68,12 @@ def chooseCells(matrix: list[list[int]], cells: int):
             if matrix[i][j] != 0:
                 filled_cells.append((i, j))
     
+    if unique:
+        return chooseUniqueCells(matrix, filled_cells, cells, rng)
+
     # sample elige elementos aleatorios sin repeticion de una lista, set o conjunto
     # min es para que no se elijan mas celdas que las que hay
-    cells_to_remove = sample(filled_cells, min(cells, len(filled_cells)))
+    cells_to_remove = rng.sample(filled_cells, min(cells, len(filled_cells)))
     
     # vaciar las celdas elegidas
     for row, col in cells_to_remove:
@@ -74,17 +81,43 @@ def chooseCells(matrix: list[list[int]], cells: int):
     
     return matrix
 
-def makeDifficulty(matrix: list[list[int]], difficulty: Literal['easy', 'medium', 'hard']):
+# vacia celdas de a una, en orden aleatorio, sin perder la unicidad de la solucion
+# si vaciar una celda deja el puzzle con mas de una solucion, se vuelve a poner
+# la matriz tiene que ser un sudoku resuelto (o un puzzle con solucion unica)
+# si no se puede llegar a 'cells' celdas vacias se devuelve el puzzle con todas las que se pudieron vaciar
+def chooseUniqueCells(matrix: list[list[int]], filled_cells: list[tuple[int, int]], cells: int,
+                      rng: Optional[random.Random] = None):
+    from utils.solutions import has_other_solution  # import local: solutions depende de este modulo
+    rng = rng or random
+
+    removed = 0
+    for row, col in rng.sample(filled_cells, len(filled_cells)):
+        if removed == cells:
+            break
+        value = matrix[row][col]
+        matrix[row][col] = 0
+        if has_other_solution(matrix, row, col, value):
+            matrix[row][col] = value
+        else:
+            removed += 1
+
+    return matrix
+
+# unique=True garantiza que el puzzle tenga una sola solucion (ver chooseUniqueCells)
+# con rng (un random.Random con semilla) el mismo tablero da siempre el mismo puzzle
+def makeDifficulty(matrix: list[list[int]], difficulty: Literal['easy', 'medium', 'hard'], unique: bool = False,
+                   rng: Optional[random.Random] = None):
+    rng = rng or random
     # 35-50
     if difficulty == 'easy':
-        remove = randint(20, 35)
-        return chooseCells(matrix, remove)
+        remove = rng.randint(20, 35)
+        return chooseCells(matrix, remove, unique, rng)
     # 22-34
     elif difficulty == 'medium':
-        return chooseCells(matrix, randint(36, 46))
+        return chooseCells(matrix, rng.randint(36, 46), unique, rng)
     # 10-21
     elif difficulty == 'hard':
-        return chooseCells(matrix, randint(47, 57))
+        return chooseCells(matrix, rng.randint(47, 57), unique, rng)
 
 # inicializa la matriz con todos los valores en 0
 # podriamos aca directamente ya popular la matriz? 
@@ -96,26 +129,16 @@ def generateValues() -> list[int]:
 
 # los cuadrantes van de 0 a 8, el 0 es el cuadrante superior izquierdo, el 8 es el cuadrante inferior derecho
 def returnCuadrante(row: int, col: int) -> int:
-    cuadrante_row = row // 3
-    cuadrante_col = col // 3
-    
-    return cuadrante_row * 3 + cuadrante_col
+    return BOX_OF[row][col]
 
 # podas implicitas
-# chequeo por cuadrante
+# chequeo por cuadrante (las celdas de cada cuadrante vienen precalculadas en utils.indices)
 def checkCuadrante(matrix: list[list[int]], v: int, row: int, col: int) -> bool:
-    cuadrante_id = (row // 3) * 3 + (col // 3)
-    cuadrante_row = (row // 3) * 3
-    cuadrante_col = (col // 3) * 3
-
-    for i in range(3):
-        for j in range(3):
-            actual_row = cuadrante_row + i
-            actual_col = cuadrante_col + j
-            if actual_row == row and actual_col == col:
-                continue
-            if matrix[actual_row][actual_col] == v:
-                return False
+    for actual_row, actual_col in BOX_CELLS[BOX_OF[row][col]]:
+        if actual_row == row and actual_col == col:
+            continue
+        if matrix[actual_row][actual_col] == v:
+            return False
     return True
 
 # chequeo por columna
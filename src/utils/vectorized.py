@@ -0,0 +1,143 @@
+"""
+Solver vectorizado con NumPy: resuelve miles de puzzles a la vez.
+
+Los N puzzles se guardan en un array (N, 81) y los candidatos de cada celda como
+máscaras de 9 bits (N, 81), igual que en BitBoard pero para todo el lote. Cada
+ronda aplica a todos los puzzles activos, con operaciones de NumPy:
+- eliminación: los candidatos de una celda son los valores que no usan sus 20 vecinos
+- naked singles: celdas con un solo candidato
+- hidden singles: valores que en una unidad sólo entran en una celda
+y se repite mientras algún puzzle avance. Los que quedan sin resolver (los que
+necesitan ramificar) se terminan de a uno con un solver clásico (fallback).
+
+NumPy es una dependencia opcional: sólo se importa al usar este módulo
+(utils.batch lo carga recién cuando se pide el motor 'numpy_batch').
+"""
+
+from time import perf_counter
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from utils.batch import SolveResult, solve_one
+from utils.board import Board
+from utils.indices import PEER_INDICES, UNIT_INDICES
+from utils.stats import SolveStats
+
+FULL_MASK = 0x1FF
+
+# Tamaño de las tandas que se propagan juntas (acota la memoria de los arrays intermedios)
+CHUNK_SIZE = 4096
+
+_PEERS = np.array(PEER_INDICES, dtype=np.intp)     # (81, 20)
+_UNITS = np.array(UNIT_INDICES, dtype=np.intp)     # (27, 9)
+# Valor (0-9) -> bit; el 0 (vacía) no tiene bit
+_BIT = np.array([0] + [1 << (v - 1) for v in range(1, 10)], dtype=np.uint16)
+# Bit de cada dígito, para separar una máscara en sus 9 candidatos
+_DIGIT_BITS = _BIT[1:]
+# Máscara con un solo bit -> valor; cualquier otra máscara -> 0
+_SINGLE = np.zeros(FULL_MASK + 1, dtype=np.int8)
+_SINGLE[_DIGIT_BITS] = np.arange(1, 10, dtype=np.int8)
+
+
+def _has_duplicates(values: np.ndarray) -> np.ndarray:
+    """Para cada puzzle, True si algún valor se repite en una unidad."""
+    unit_bits = _BIT[values][:, _UNITS]                                     # (N, 27, 9)
+    # Los bits son potencias de 2 distintas: la suma coincide con el OR sólo si no hay repetidos
+    total = unit_bits.sum(axis=2, dtype=np.int32)
+    return (total != np.bitwise_or.reduce(unit_bits, axis=2)).any(axis=1)
+
+
+def propagate_batch(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Aplica eliminación, naked singles y hidden singles a todo el lote hasta que ningún
+    puzzle avance.
+
+    Args:
+        grid: Array (N, 81) con los valores (0 = vacía); no se modifica
+
+    Returns:
+        tuple: (valores después de propagar, máscara (N,) de puzzles sin solución)
+    """
+    values = grid.astype(np.int8, copy=True)
+    dead = _has_duplicates(values)
+    active = np.flatnonzero(~dead)
+
+    while active.size:
+        current = values[active]
+        bits = _BIT[current]                                                # (A, 81)
+        empty = current == 0
+        used = np.bitwise_or.reduce(bits[:, _PEERS], axis=2)                # (A, 81)
+        candidates = np.where(empty, ~used & FULL_MASK, 0).astype(np.uint16)
+
+        # Celda vacía sin candidatos: contradicción
+        bad = (empty & (candidates == 0)).any(axis=1)
+
+        # Naked singles
+        assign = np.where(empty, _SINGLE[candidates], 0).astype(np.int8)
+
+        # Hidden singles: por unidad y dígito, en cuántas celdas entra
+        has = (candidates[:, _UNITS][..., None] & _DIGIT_BITS) != 0         # (A, 27, 9 celdas, 9 dígitos)
+        count = has.sum(axis=2)                                             # (A, 27, 9)
+        placed = (np.bitwise_or.reduce(bits[:, _UNITS], axis=2)[..., None] & _DIGIT_BITS) != 0
+        # Un dígito que falta en la unidad y no entra en ninguna celda: contradicción
+        bad |= ((count == 0) & ~placed).any(axis=(1, 2))
+        puzzle, unit, digit = np.nonzero((count == 1) & ~placed)
+        cell = _UNITS[unit, has[puzzle, unit, :, digit].argmax(axis=1)]
+        assign[puzzle, cell] = digit + 1
+
+        values[active] = np.where(assign != 0, assign, current)
+        # Dos asignaciones forzadas con el mismo valor en una unidad: contradicción
+        bad |= _has_duplicates(values[active])
+        dead[active[bad]] = True
+        active = active[(assign != 0).any(axis=1) & ~bad]
+
+    return values, dead
+
+
+def _as_grid(puzzles: Sequence[Union[list[list[int]], Board]]) -> np.ndarray:
+    rows = [bytes(p.grid) if isinstance(p, Board) else bytes(v for row in p for v in row) for p in puzzles]
+    return np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), 81)
+
+
+def solve_batch(puzzles: Sequence[Union[list[list[int]], Board]], fallback: str = "dancing_links",
+                time_limit: Optional[float] = None, max_nodes: Optional[int] = None,
+                **options) -> list[SolveResult]:
+    """
+    Resuelve el lote propagando todos los puzzles juntos y buscando sólo en los que lo necesitan.
+
+    Args:
+        puzzles: Matrices 9x9 o Boards (no se modifican)
+        fallback: Solver de utils.solvers para los puzzles que la propagación no termina
+        time_limit: Segundos máximos de la búsqueda de cada puzzle del fallback
+        max_nodes: Candidatos probados máximos de cada puzzle del fallback
+        **options: Argumentos extra para el fallback
+
+    Returns:
+        list[SolveResult]: Uno por puzzle, en orden. El tiempo de la propagación en lote
+        se reparte en partes iguales; los nodos son los del fallback (0 si no hizo falta)
+        y stats.propagation_hits las celdas que completó la propagación.
+    """
+    results: list[SolveResult] = []
+    for first in range(0, len(puzzles), CHUNK_SIZE):
+        chunk = puzzles[first:first + CHUNK_SIZE]
+        grid = _as_grid(chunk)
+
+        start = perf_counter()
+        values, dead = propagate_batch(grid)
+        share = (perf_counter() - start) / len(chunk)
+        filled = (values != 0).sum(axis=1) - (grid != 0).sum(axis=1)
+        complete = (values != 0).all(axis=1)
+
+        for i in range(len(chunk)):
+            stats = SolveStats()
+            stats.propagation_hits = int(filled[i])
+            if dead[i]:
+                results.append(SolveResult(None, share, 0, stats, 'unsolvable'))
+            elif complete[i]:
+                results.append(SolveResult(values[i].reshape(9, 9).tolist(), share, 0, stats, 'solved'))
+            else:
+                result = solve_one(values[i].reshape(9, 9).tolist(), fallback, time_limit=time_limit,
+                                   max_nodes=max_nodes, stats=stats, **options)
+                results.append(result._replace(time=result.time + share))
+    return results